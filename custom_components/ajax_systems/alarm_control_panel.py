@@ -13,10 +13,10 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import AjaxAlarmState, DOMAIN
 from .coordinator import AjaxDataCoordinator
+from .entity import AjaxDeviceEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,7 +33,7 @@ async def async_setup_entry(
         async_add_entities([AjaxAlarmPanel(coordinator)])
 
 
-class AjaxAlarmPanel(CoordinatorEntity[AjaxDataCoordinator], AlarmControlPanelEntity):
+class AjaxAlarmPanel(AjaxDeviceEntity, AlarmControlPanelEntity):
     """Representation of an Ajax alarm panel."""
     
     _attr_has_entity_name = True
@@ -51,6 +51,11 @@ class AjaxAlarmPanel(CoordinatorEntity[AjaxDataCoordinator], AlarmControlPanelEn
         self._hub = coordinator.data.hub
         self._attr_unique_id = f"{DOMAIN}_{self._hub.device_id}"
     
+    @property
+    def _listen_device_id(self) -> str:
+        """Return the hub, whose updates carry the alarm state."""
+        return self._hub.device_id
+    
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
@@ -35,7 +35,11 @@ AJAX_SERVICE_PATH = "/core/api/jeeApi.php"
 
 class JeedomProxyError(Exception):
     """Base exception for Jeedom proxy errors."""
-    pass
+    
+    def __init__(self, message: str = "", status: Optional[int] = None) -> None:
+        """Initialize the error with the HTTP status code, if any."""
+        super().__init__(message)
+        self.status = status
 
 
 class JeedomAuthError(JeedomProxyError):
@@ -135,6 +139,7 @@ class JeedomAjaxProxy:
         self._session_token: Optional[str] = None
         self._refresh_token: Optional[str] = None
         self._authenticated = False
+        self._auth_lock = asyncio.Lock()
         
         # Cached data
         self._hubs: dict[str, AjaxHubData] = {}
@@ -158,6 +163,14 @@ class JeedomAjaxProxy:
         if self._own_session and self._session and not self._session.closed:
             await self._session.close()
     
+    async def __aenter__(self) -> JeedomAjaxProxy:
+        """Enter the async context."""
+        return self
+    
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the API client when leaving the async context."""
+        await self.close()
+    
     async def _request(
         self,
         path: str,
@@ -216,16 +229,21 @@ class JeedomAjaxProxy:
             
             async with session.request(method, url, **kwargs) as response:
                 text = await response.text()
-                _LOGGER.debug("Jeedom response: %s", text[:500])
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Jeedom response: %s", text[:500])
                 
                 if response.status == 401:
-                    raise JeedomAuthError("Invalid Jeedom API key")
+                    raise JeedomAuthError("Invalid Jeedom API key", status=401)
                 
                 if response.status == 403:
-                    raise JeedomAuthError("Access denied - check API key permissions")
+                    raise JeedomAuthError(
+                        "Access denied - check API key permissions", status=403
+                    )
                 
                 if response.status != 200:
-                    raise JeedomProxyError(f"HTTP {response.status}: {text}")
+                    raise JeedomProxyError(
+                        f"HTTP {response.status}: {text}", status=response.status
+                    )
                 
                 result = json.loads(text)
                 
@@ -289,6 +307,15 @@ class JeedomAjaxProxy:
         except Exception as err:
             raise JeedomAuthError(f"Authentication failed: {err}") from err
     
+    async def _ensure_authenticated(self) -> None:
+        """Authenticate once, even if several requests need it concurrently."""
+        if self._authenticated:
+            return
+        
+        async with self._auth_lock:
+            if not self._authenticated:
+                await self.authenticate()
+    
     async def refresh_token(self) -> bool:
         """Refresh the session token.
         
@@ -324,21 +351,29 @@ class JeedomAjaxProxy:
         Returns:
             List of hub data
         """
-        if not self._authenticated:
-            await self.authenticate()
+        await self._ensure_authenticated()
         
         try:
             hubs_list = await self._request("/user/{userId}/hubs")
             
+            hub_ids = [
+                hub_basic.get("hubId") for hub_basic in hubs_list
+                if hub_basic.get("hubId")
+            ]
+            
+            # Get detailed hub info for all hubs concurrently
+            hub_infos = await asyncio.gather(*(
+                self._request(f"/user/{{userId}}/hubs/{hub_id}")
+                for hub_id in hub_ids
+            ), return_exceptions=True)
+            
             hubs = []
-            for hub_basic in hubs_list:
-                hub_id = hub_basic.get("hubId")
-                if not hub_id:
+            for hub_id, hub_info in zip(hub_ids, hub_infos):
+                # One unreachable hub must not hide the others
+                if isinstance(hub_info, Exception):
+                    _LOGGER.warning("Failed to get hub %s: %s", hub_id, hub_info)
                     continue
                 
-                # Get detailed hub info
-                hub_info = await self._request(f"/user/{{userId}}/hubs/{hub_id}")
-                
                 hub = AjaxHubData(
                     hub_id=hub_id,
                     name=hub_info.get("name", f"Ajax Hub {hub_id}"),
@@ -376,8 +411,7 @@ class JeedomAjaxProxy:
         Returns:
             List of device data
         """
-        if not self._authenticated:
-            await self.authenticate()
+        await self._ensure_authenticated()
         
         try:
             devices_list = await self._request(
@@ -438,8 +472,7 @@ class JeedomAjaxProxy:
         Returns:
             List of group data
         """
-        if not self._authenticated:
-            await self.authenticate()
+        await self._ensure_authenticated()
         
         try:
             return await self._request(f"/user/{{userId}}/hubs/{hub_id}/groups")
@@ -16,6 +16,7 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import AjaxDeviceType, DOMAIN
 from .coordinator import AjaxDataCoordinator
+from .entity import AjaxDeviceEntity
 from .models import (
     AjaxDevice,
     AjaxDoorSensor,
@@ -90,7 +91,7 @@ async def async_setup_entry(
     _LOGGER.info("Binary sensor platform setup complete. %d devices tracked.", len(added_devices))
 
 
-class AjaxBaseBinarySensor(CoordinatorEntity[AjaxDataCoordinator], BinarySensorEntity):
+class AjaxBaseBinarySensor(AjaxDeviceEntity, BinarySensorEntity):
     """Base class for Ajax binary sensors."""
     
     _attr_has_entity_name = True
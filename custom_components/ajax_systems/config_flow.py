@@ -1,7 +1,11 @@
 """Config flow for Ajax Systems integration."""
 from __future__ import annotations
 
+import functools
 import logging
+from collections import ChainMap
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 import voluptuous as vol
@@ -38,82 +42,148 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Unique ID namespace for MQTT bridge entries
+_UID_PREFIX_MQTT = "ajax_mqtt_"
+
+# Defaults for every field of the user step, merged under the submitted data
+_USER_DEFAULTS: dict[str, Any] = {
+    CONF_HUB_ID: "ajax_hub",
+    CONF_JEEDOM_MQTT_TOPIC: DEFAULT_JEEDOM_MQTT_TOPIC,
+    CONF_JEEDOM_MQTT_LANGUAGE: "it",
+    CONF_USE_SIA: False,
+    CONF_SIA_PORT: DEFAULT_SIA_PORT,
+    CONF_SIA_ACCOUNT: "AAA",
+    CONF_SIA_ENCRYPTION_KEY: "",
+}
+
+# Languages offered for Jeedom MQTT command names
+_LANGUAGE_CHOICES = MappingProxyType({
+    "it": "Italiano",
+    "en": "English",
+})
+
+# Selectors are stateless, so one instance is shared by every schema
+_BOOL_SELECTOR = BooleanSelector()
+_PORT_SELECTOR = NumberSelector(
+    NumberSelectorConfig(min=1, max=65535, step=1, mode="box")
+)
+_TEXT_SELECTOR = TextSelector(TextSelectorConfig(type=TextSelectorType.TEXT))
+_PASSWORD_SELECTOR = TextSelector(
+    TextSelectorConfig(type=TextSelectorType.PASSWORD)
+)
+
+
+def _sia_fields(defaults: Mapping[str, Any]) -> dict[vol.Marker, Any]:
+    """Return the SIA receiver fields shared by the config and options flows."""
+    return {
+        vol.Optional(
+            CONF_USE_SIA,
+            default=defaults.get(CONF_USE_SIA, False),
+        ): _BOOL_SELECTOR,
+        vol.Optional(
+            CONF_SIA_PORT,
+            default=defaults.get(CONF_SIA_PORT, DEFAULT_SIA_PORT),
+        ): _PORT_SELECTOR,
+        vol.Optional(
+            CONF_SIA_ACCOUNT,
+            default=defaults.get(CONF_SIA_ACCOUNT, "AAA"),
+        ): _TEXT_SELECTOR,
+    }
+
+
+@functools.cache
+def _user_schema() -> vol.Schema:
+    """Return the user step schema, building it on first use.
+    
+    The schema has no per-entry defaults, so one instance serves every flow.
+    """
+    return vol.Schema({
+        vol.Required(CONF_HUB_ID, default="ajax_hub"): _TEXT_SELECTOR,
+        vol.Required(CONF_JEEDOM_MQTT_TOPIC, default=DEFAULT_JEEDOM_MQTT_TOPIC): _TEXT_SELECTOR,
+        vol.Required(CONF_JEEDOM_MQTT_LANGUAGE, default="it"): vol.In(_LANGUAGE_CHOICES),
+        **_sia_fields({}),
+        vol.Optional(CONF_SIA_ENCRYPTION_KEY): _PASSWORD_SELECTOR,
+    })
+
+
+@functools.lru_cache(maxsize=8)
+def _build_options_schema(
+    mqtt_topic: str,
+    language: str,
+    cmd_arm: str,
+    cmd_disarm: str,
+    cmd_night_mode: str,
+    use_sia: bool,
+    sia_port: int,
+    sia_account: str,
+) -> vol.Schema:
+    """Build the options schema for the given current values.
+    
+    Cached so reopening the options dialog for an unchanged entry reuses
+    the same schema instead of rebuilding it.
+    """
+    return vol.Schema({
+        vol.Optional(
+            CONF_JEEDOM_MQTT_TOPIC,
+            default=mqtt_topic,
+        ): _TEXT_SELECTOR,
+        vol.Optional(
+            CONF_JEEDOM_MQTT_LANGUAGE,
+            default=language,
+        ): vol.In(_LANGUAGE_CHOICES),
+        vol.Optional(
+            CONF_JEEDOM_CMD_ARM,
+            description={"suggested_value": cmd_arm},
+        ): _TEXT_SELECTOR,
+        vol.Optional(
+            CONF_JEEDOM_CMD_DISARM,
+            description={"suggested_value": cmd_disarm},
+        ): _TEXT_SELECTOR,
+        vol.Optional(
+            CONF_JEEDOM_CMD_NIGHT_MODE,
+            description={"suggested_value": cmd_night_mode},
+        ): _TEXT_SELECTOR,
+        **_sia_fields({
+            CONF_USE_SIA: use_sia,
+            CONF_SIA_PORT: sia_port,
+            CONF_SIA_ACCOUNT: sia_account,
+        }),
+    })
+
 
 class AjaxSystemsConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Ajax Systems."""
     
     VERSION = 1
     
-    def __init__(self) -> None:
-        """Initialize the config flow."""
-        self._data: dict[str, Any] = {}
-    
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the initial step - configure MQTT Bridge directly."""
-        errors: dict[str, str] = {}
-        
         if user_input is not None:
-            mqtt_topic = user_input.get(CONF_JEEDOM_MQTT_TOPIC, DEFAULT_JEEDOM_MQTT_TOPIC)
-            language = user_input.get(CONF_JEEDOM_MQTT_LANGUAGE, "it")
-            use_sia = user_input.get(CONF_USE_SIA, False)
-            hub_id = user_input.get(CONF_HUB_ID, "ajax_hub")
-            
-            self._data = {
-                CONF_USE_SIA: use_sia,
+            data = {
+                **_USER_DEFAULTS,
+                **user_input,
                 CONF_USE_MQTT: True,
                 CONF_JEEDOM_MQTT_ENABLED: True,
-                CONF_JEEDOM_MQTT_TOPIC: mqtt_topic,
-                CONF_JEEDOM_MQTT_LANGUAGE: language,
-                CONF_HUB_ID: hub_id,
             }
-            
-            # Add SIA config if enabled
-            if use_sia:
-                self._data[CONF_SIA_PORT] = user_input.get(CONF_SIA_PORT, DEFAULT_SIA_PORT)
-                self._data[CONF_SIA_ACCOUNT] = user_input.get(CONF_SIA_ACCOUNT, "AAA")
-                self._data[CONF_SIA_ENCRYPTION_KEY] = user_input.get(CONF_SIA_ENCRYPTION_KEY, "")
+            mqtt_topic = data[CONF_JEEDOM_MQTT_TOPIC]
+            use_sia = data[CONF_USE_SIA]
+            hub_id = data[CONF_HUB_ID]
             
             # Check for existing entry
-            await self.async_set_unique_id(f"ajax_mqtt_{mqtt_topic.replace('/', '_')}")
+            unique_id = _UID_PREFIX_MQTT + mqtt_topic.replace("/", "_")
+            await self.async_set_unique_id(unique_id)
             self._abort_if_unique_id_configured()
             
-            title = f"Ajax MQTT ({hub_id})"
-            if use_sia:
-                sia_port = self._data.get(CONF_SIA_PORT, DEFAULT_SIA_PORT)
-                title = f"Ajax MQTT + SIA ({hub_id})"
-            
             return self.async_create_entry(
-                title=title,
-                data=self._data,
+                title=f"Ajax MQTT{' + SIA' if use_sia else ''} ({hub_id})",
+                data=data,
             )
         
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema({
-                vol.Required(CONF_HUB_ID, default="ajax_hub"): TextSelector(
-                    TextSelectorConfig(type=TextSelectorType.TEXT)
-                ),
-                vol.Required(CONF_JEEDOM_MQTT_TOPIC, default=DEFAULT_JEEDOM_MQTT_TOPIC): TextSelector(
-                    TextSelectorConfig(type=TextSelectorType.TEXT)
-                ),
-                vol.Required(CONF_JEEDOM_MQTT_LANGUAGE, default="it"): vol.In({
-                    "it": "Italiano",
-                    "en": "English",
-                }),
-                vol.Optional(CONF_USE_SIA, default=False): BooleanSelector(),
-                vol.Optional(CONF_SIA_PORT, default=DEFAULT_SIA_PORT): NumberSelector(
-                    NumberSelectorConfig(min=1, max=65535, step=1, mode="box")
-                ),
-                vol.Optional(CONF_SIA_ACCOUNT, default="AAA"): TextSelector(
-                    TextSelectorConfig(type=TextSelectorType.TEXT)
-                ),
-                vol.Optional(CONF_SIA_ENCRYPTION_KEY): TextSelector(
-                    TextSelectorConfig(type=TextSelectorType.PASSWORD)
-                ),
-            }),
-            errors=errors,
+            data_schema=_user_schema(),
         )
     
     @staticmethod
@@ -136,57 +206,18 @@ class AjaxOptionsFlow(OptionsFlow):
             return self.async_create_entry(title="", data=user_input)
         
         # Get current values from config entry
-        current_data = {**self.config_entry.data, **self.config_entry.options}
+        current_data = ChainMap(self.config_entry.options, self.config_entry.data)
         
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema({
-                vol.Optional(
-                    CONF_JEEDOM_MQTT_TOPIC,
-                    default=current_data.get(CONF_JEEDOM_MQTT_TOPIC, DEFAULT_JEEDOM_MQTT_TOPIC),
-                ): TextSelector(
-                    TextSelectorConfig(type=TextSelectorType.TEXT)
-                ),
-                vol.Optional(
-                    CONF_JEEDOM_MQTT_LANGUAGE,
-                    default=current_data.get(CONF_JEEDOM_MQTT_LANGUAGE, "it"),
-                ): vol.In({
-                    "it": "Italiano",
-                    "en": "English",
-                }),
-                vol.Optional(
-                    CONF_JEEDOM_CMD_ARM,
-                    description={"suggested_value": current_data.get(CONF_JEEDOM_CMD_ARM, "")},
-                ): TextSelector(
-                    TextSelectorConfig(type=TextSelectorType.TEXT)
-                ),
-                vol.Optional(
-                    CONF_JEEDOM_CMD_DISARM,
-                    description={"suggested_value": current_data.get(CONF_JEEDOM_CMD_DISARM, "")},
-                ): TextSelector(
-                    TextSelectorConfig(type=TextSelectorType.TEXT)
-                ),
-                vol.Optional(
-                    CONF_JEEDOM_CMD_NIGHT_MODE,
-                    description={"suggested_value": current_data.get(CONF_JEEDOM_CMD_NIGHT_MODE, "")},
-                ): TextSelector(
-                    TextSelectorConfig(type=TextSelectorType.TEXT)
-                ),
-                vol.Optional(
-                    CONF_USE_SIA,
-                    default=current_data.get(CONF_USE_SIA, False),
-                ): BooleanSelector(),
-                vol.Optional(
-                    CONF_SIA_PORT,
-                    default=current_data.get(CONF_SIA_PORT, DEFAULT_SIA_PORT),
-                ): NumberSelector(
-                    NumberSelectorConfig(min=1, max=65535, step=1, mode="box")
-                ),
-                vol.Optional(
-                    CONF_SIA_ACCOUNT,
-                    default=current_data.get(CONF_SIA_ACCOUNT, "AAA"),
-                ): TextSelector(
-                    TextSelectorConfig(type=TextSelectorType.TEXT)
-                ),
-            }),
+            data_schema=_build_options_schema(
+                current_data.get(CONF_JEEDOM_MQTT_TOPIC, DEFAULT_JEEDOM_MQTT_TOPIC),
+                current_data.get(CONF_JEEDOM_MQTT_LANGUAGE, "it"),
+                current_data.get(CONF_JEEDOM_CMD_ARM, ""),
+                current_data.get(CONF_JEEDOM_CMD_DISARM, ""),
+                current_data.get(CONF_JEEDOM_CMD_NIGHT_MODE, ""),
+                current_data.get(CONF_USE_SIA, False),
+                current_data.get(CONF_SIA_PORT, DEFAULT_SIA_PORT),
+                current_data.get(CONF_SIA_ACCOUNT, "AAA"),
+            ),
         )
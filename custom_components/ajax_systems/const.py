@@ -1,5 +1,6 @@
 """Constants for Ajax Systems integration."""
 from enum import StrEnum
+from types import MappingProxyType
 from typing import Final
 
 DOMAIN: Final = "ajax_systems"
@@ -119,7 +120,7 @@ class AjaxCommand(StrEnum):
 
 # SIA event codes mapping
 # Based on SIA DC-09 standard + Ajax-specific codes
-SIA_EVENT_CODES: Final = {
+SIA_EVENT_CODES: Final = MappingProxyType({
     # Alarms
     "BA": "Burglar Alarm",
     "BR": "Burglar Alarm Restore",
@@ -196,33 +197,33 @@ SIA_EVENT_CODES: Final = {
     "LU": "Log Full",
     "RY": "Module Added",
     "RZ": "Module Removed",
-}
+})
 
 # Device type to platform mapping
-DEVICE_PLATFORM_MAP: Final = {
-    AjaxDeviceType.HUB: ["alarm_control_panel", "sensor"],
-    AjaxDeviceType.HUB_2: ["alarm_control_panel", "sensor"],
-    AjaxDeviceType.HUB_2_PLUS: ["alarm_control_panel", "sensor"],
-    AjaxDeviceType.DOOR_PROTECT: ["binary_sensor", "sensor"],
-    AjaxDeviceType.DOOR_PROTECT_PLUS: ["binary_sensor", "sensor"],
-    AjaxDeviceType.MOTION_PROTECT: ["binary_sensor", "sensor"],
-    AjaxDeviceType.MOTION_PROTECT_PLUS: ["binary_sensor", "sensor"],
-    AjaxDeviceType.MOTION_CAM: ["binary_sensor", "sensor", "camera"],
-    AjaxDeviceType.GLASS_PROTECT: ["binary_sensor", "sensor"],
-    AjaxDeviceType.FIRE_PROTECT: ["binary_sensor", "sensor"],
-    AjaxDeviceType.FIRE_PROTECT_PLUS: ["binary_sensor", "sensor"],
-    AjaxDeviceType.FIRE_PROTECT_2: ["binary_sensor", "sensor"],
-    AjaxDeviceType.LEAKS_PROTECT: ["binary_sensor", "sensor"],
-    AjaxDeviceType.SPACE_CONTROL: ["sensor"],
-    AjaxDeviceType.BUTTON: ["sensor"],
-    AjaxDeviceType.KEYPAD: ["sensor"],
-    AjaxDeviceType.SIREN_INDOOR: ["switch", "sensor"],
-    AjaxDeviceType.SIREN_OUTDOOR: ["switch", "sensor"],
-    AjaxDeviceType.RELAY: ["switch"],
-    AjaxDeviceType.WALL_SWITCH: ["switch"],
-    AjaxDeviceType.SOCKET: ["switch", "sensor"],
-    AjaxDeviceType.LIGHT_SWITCH: ["light"],
-}
+DEVICE_PLATFORM_MAP: Final = MappingProxyType({
+    AjaxDeviceType.HUB: ("alarm_control_panel", "sensor"),
+    AjaxDeviceType.HUB_2: ("alarm_control_panel", "sensor"),
+    AjaxDeviceType.HUB_2_PLUS: ("alarm_control_panel", "sensor"),
+    AjaxDeviceType.DOOR_PROTECT: ("binary_sensor", "sensor"),
+    AjaxDeviceType.DOOR_PROTECT_PLUS: ("binary_sensor", "sensor"),
+    AjaxDeviceType.MOTION_PROTECT: ("binary_sensor", "sensor"),
+    AjaxDeviceType.MOTION_PROTECT_PLUS: ("binary_sensor", "sensor"),
+    AjaxDeviceType.MOTION_CAM: ("binary_sensor", "sensor", "camera"),
+    AjaxDeviceType.GLASS_PROTECT: ("binary_sensor", "sensor"),
+    AjaxDeviceType.FIRE_PROTECT: ("binary_sensor", "sensor"),
+    AjaxDeviceType.FIRE_PROTECT_PLUS: ("binary_sensor", "sensor"),
+    AjaxDeviceType.FIRE_PROTECT_2: ("binary_sensor", "sensor"),
+    AjaxDeviceType.LEAKS_PROTECT: ("binary_sensor", "sensor"),
+    AjaxDeviceType.SPACE_CONTROL: ("sensor",),
+    AjaxDeviceType.BUTTON: ("sensor",),
+    AjaxDeviceType.KEYPAD: ("sensor",),
+    AjaxDeviceType.SIREN_INDOOR: ("switch", "sensor"),
+    AjaxDeviceType.SIREN_OUTDOOR: ("switch", "sensor"),
+    AjaxDeviceType.RELAY: ("switch",),
+    AjaxDeviceType.WALL_SWITCH: ("switch",),
+    AjaxDeviceType.SOCKET: ("switch", "sensor"),
+    AjaxDeviceType.LIGHT_SWITCH: ("light",),
+})
 
 # Platforms to load
 PLATFORMS: Final = [
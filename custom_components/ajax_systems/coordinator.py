@@ -1,11 +1,15 @@
 """Data coordinator for Ajax Systems integration."""
 import asyncio
+import dataclasses
+import functools
 import logging
-from datetime import timedelta
+from collections import ChainMap, deque
 from typing import Any, Optional
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
@@ -24,13 +28,105 @@ from .const import (
     DEFAULT_SIA_PORT,
     DEFAULT_JEEDOM_MQTT_TOPIC,
     DOMAIN,
+    SIA_EVENT_CODES,
+    AjaxAlarmState,
+    AjaxDeviceType,
+)
+from .models import (
+    AjaxCoordinator,
+    AjaxDevice,
+    AjaxDoorSensor,
+    AjaxFireSensor,
+    AjaxHub,
+    AjaxLeakSensor,
+    AjaxMotionSensor,
+    SiaEvent,
 )
-from .models import AjaxCoordinator, AjaxDevice, AjaxHub, SiaEvent
 from .sia import SiaConfig, SiaReceiver, sia_event_to_alarm_state, sia_event_to_sensor_state
 
 _LOGGER = logging.getLogger(__name__)
 
-UPDATE_INTERVAL = timedelta(minutes=5)
+try:
+    from .jeedom_mqtt_handler import JeedomDevice, JeedomMqttHandler, is_virtual_device
+except ImportError as err:
+    # Jeedom MQTT stays optional, _setup_jeedom_mqtt reports the failure
+    _JEEDOM_IMPORT_ERROR: Optional[ImportError] = err
+    JeedomDevice = JeedomMqttHandler = is_virtual_device = None
+else:
+    _JEEDOM_IMPORT_ERROR = None
+
+# Signal prefix for updates that only touch one device, suffixed with its ID
+SIGNAL_DEVICE_UPDATE = f"{DOMAIN}_device_update"
+
+# Window in seconds for coalescing bursts of push updates into one notification
+UPDATE_DEBOUNCE = 0.05
+
+# Window in seconds for collecting SIA events into one MQTT publish task
+MQTT_EVENT_BATCH_WINDOW = 0.1
+
+# Jeedom device attribute -> Ajax device field, common ones first
+_JEEDOM_FIELDS = (
+    ("online", "online"),
+    ("tamper", "tamper"),
+    ("battery", "battery_level"),
+    ("temperature", "temperature"),
+    ("is_open", "is_open"),
+    ("motion", "motion_detected"),
+    ("leak", "leak_detected"),
+    ("smoke", "smoke_detected"),
+)
+
+# Sensor state keys a SIA event may carry, named after the device fields
+_SIA_SENSOR_FIELDS = ("is_open", "motion_detected", "leak_detected", "smoke_detected", "tamper")
+
+
+# Jeedom device type -> (device class, Ajax type, state field, Jeedom attribute)
+_JEEDOM_DEVICE_TYPES: dict[str, tuple[type[AjaxDevice], AjaxDeviceType, Optional[str], Optional[str]]] = {
+    "door": (AjaxDoorSensor, AjaxDeviceType.DOOR_PROTECT, "is_open", "is_open"),
+    "motion": (AjaxMotionSensor, AjaxDeviceType.MOTION_PROTECT, "motion_detected", "motion"),
+    "leak": (AjaxLeakSensor, AjaxDeviceType.LEAKS_PROTECT, "leak_detected", "leak"),
+    "smoke": (AjaxFireSensor, AjaxDeviceType.FIRE_PROTECT, "smoke_detected", "smoke"),
+    "siren": (AjaxDevice, AjaxDeviceType.SIREN_OUTDOOR, None, None),
+    "keypad": (AjaxDevice, AjaxDeviceType.KEYPAD, None, None),
+    "remote": (AjaxDevice, AjaxDeviceType.SPACE_CONTROL, None, None),
+}
+
+# Same layout, tried in order for unknown types until a Jeedom attribute is set
+_JEEDOM_INFERRED_TYPES = tuple(
+    _JEEDOM_DEVICE_TYPES[device_type]
+    for device_type in ("door", "motion", "leak", "smoke")
+)
+
+# Jeedom types that never replace a generic device with a specific one
+_NON_UPGRADE_TYPES = frozenset({"unknown", "hub"})
+
+# SIA sensor type -> (device class, Ajax type, extra constructor arguments)
+_SIA_DEVICE_TYPES: dict[str, tuple[type[AjaxDevice], AjaxDeviceType, dict[str, Any]]] = {
+    "door": (AjaxDoorSensor, AjaxDeviceType.DOOR_PROTECT, {}),
+    "motion": (AjaxMotionSensor, AjaxDeviceType.MOTION_PROTECT, {}),
+    "leak": (AjaxLeakSensor, AjaxDeviceType.LEAKS_PROTECT, {}),
+    "fire": (AjaxFireSensor, AjaxDeviceType.FIRE_PROTECT, {}),
+    # For tamper, we create a generic device
+    "tamper": (AjaxDevice, AjaxDeviceType.MOTION_PROTECT, {"tamper": True}),
+}
+
+
+# Bound once for the description of every published SIA event
+_sia_event_description = SIA_EVENT_CODES.get
+
+
+@functools.cache
+def _jeedom_fields(device_class: type) -> tuple[tuple[str, str], ...]:
+    """Return the (Jeedom attribute, device field) pairs a device class supports."""
+    fields = {field.name for field in dataclasses.fields(device_class)}
+    return tuple(pair for pair in _JEEDOM_FIELDS if pair[1] in fields)
+
+
+@functools.cache
+def _sia_sensor_fields(device_class: type) -> tuple[str, ...]:
+    """Return the SIA sensor state fields a device class supports."""
+    fields = {field.name for field in dataclasses.fields(device_class)}
+    return tuple(attr for attr in _SIA_SENSOR_FIELDS if attr in fields)
 
 
 class AjaxDataCoordinator(DataUpdateCoordinator[AjaxCoordinator]):
@@ -46,7 +142,8 @@ class AjaxDataCoordinator(DataUpdateCoordinator[AjaxCoordinator]):
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=UPDATE_INTERVAL,
+            # SIA and Jeedom MQTT push every change, there is nothing to poll
+            update_interval=None,
         )
         
         self.entry = entry
@@ -64,40 +161,47 @@ class AjaxDataCoordinator(DataUpdateCoordinator[AjaxCoordinator]):
         self._mqtt_publisher = None
         self._use_mqtt_publish = entry.data.get(CONF_MQTT_PUBLISH_ENABLED, False)
         
-        # List of entity IDs to track for MQTT
-        self._tracked_entity_ids: list[str] = []
+        # Entity IDs to track for MQTT
+        self._tracked_entity_ids: set[str] = set()
+        
+        # Last Jeedom update time per device with its ISO form, reused while unchanged
+        self._last_update_iso: dict[str, tuple[int, str]] = {}
+        
+        # SIA zone devices by zone number
+        self._zone_devices: dict[int, AjaxDevice] = {}
+        
+        # Pending coalesced listener notification
+        self._pending_update: Optional[asyncio.TimerHandle] = None
+        # Bound once, every push event that starts a batch window schedules through it
+        self._call_later = hass.loop.call_later
+        # Devices touched since the last notification, None to notify every listener
+        self._updated_devices: Optional[set[str]] = set()
+        
+        # SIA events waiting to be published to MQTT as (code, description, zone)
+        self._pending_alarm_events: deque[tuple[str, str, Optional[int]]] = deque()
+        self._pending_publish: Optional[asyncio.TimerHandle] = None
     
     async def async_setup(self) -> bool:
         """Set up the coordinator."""
-        sia_ok = False
-        
-        # Set up SIA receiver if enabled
-        if self._use_sia:
-            port = self.entry.data.get(CONF_SIA_PORT, DEFAULT_SIA_PORT)
-            account = self.entry.data.get(CONF_SIA_ACCOUNT, "AAA")
-            
-            config = SiaConfig(port=port, account=account)
-            self._sia_receiver = SiaReceiver(config, self._handle_sia_event)
-            
-            try:
-                if await self._sia_receiver.start():
-                    _LOGGER.info("SIA receiver started on port %d", port)
-                    self.data.connected = True
-                    sia_ok = True
-                else:
-                    _LOGGER.warning("SIA receiver failed to start (port %d may be in use)", port)
-            except Exception as err:
-                _LOGGER.warning("SIA receiver error: %s", err)
-        
-        # Set up Jeedom MQTT handler if enabled
-        jeedom_mqtt_ok = False
-        if self._use_jeedom_mqtt:
-            jeedom_mqtt_ok = await self._setup_jeedom_mqtt()
+        # SIA and Jeedom MQTT are independent, so bring them up concurrently
+        results = await asyncio.gather(
+            self._setup_sia(),
+            self._setup_jeedom_mqtt(),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                # Don't leave the other transport subscribed on a failed setup
+                await self.async_shutdown()
+                if not isinstance(result, Exception):
+                    raise result
+                # Let Home Assistant retry the entry instead of failing it for good
+                raise ConfigEntryNotReady(f"Ajax Systems setup failed: {result}") from result
+        sia_ok, jeedom_mqtt_ok = results
         
         # Create a default hub if we don't have one from cloud
         if self.data.hub is None:
             hub_id = self.entry.data.get(CONF_HUB_ID, "ajax_hub")
-            from .const import AjaxDeviceType, AjaxAlarmState
             self.data.hub = AjaxHub(
                 device_id=hub_id,
                 device_type=AjaxDeviceType.HUB_2,
@@ -120,11 +224,36 @@ class AjaxDataCoordinator(DataUpdateCoordinator[AjaxCoordinator]):
         )
         return True  # Allow setup anyway with default hub
     
+    async def _setup_sia(self) -> bool:
+        """Set up SIA receiver if enabled."""
+        if not self._use_sia:
+            return False
+        
+        port = self.entry.data.get(CONF_SIA_PORT, DEFAULT_SIA_PORT)
+        account = self.entry.data.get(CONF_SIA_ACCOUNT, "AAA")
+        
+        config = SiaConfig(port=port, account=account)
+        self._sia_receiver = SiaReceiver(config, self._handle_sia_event)
+        
+        # start() already reports bind failures (OSError) by returning False
+        if await self._sia_receiver.start():
+            _LOGGER.info("SIA receiver started on port %d", port)
+            self.data.connected = True
+            return True
+        
+        _LOGGER.warning("SIA receiver failed to start (port %d may be in use)", port)
+        return False
+    
     async def _setup_jeedom_mqtt(self) -> bool:
-        """Set up Jeedom MQTT handler."""
+        """Set up Jeedom MQTT handler if enabled."""
+        if not self._use_jeedom_mqtt:
+            return False
+        
+        if JeedomMqttHandler is None:
+            _LOGGER.error("Failed to import Jeedom MQTT handler: %s", _JEEDOM_IMPORT_ERROR)
+            return False
+        
         try:
-            from .jeedom_mqtt_handler import JeedomMqttHandler
-            
             topic = self.entry.data.get(CONF_JEEDOM_MQTT_TOPIC, DEFAULT_JEEDOM_MQTT_TOPIC)
             language = self.entry.data.get(CONF_JEEDOM_MQTT_LANGUAGE, "it")
             
@@ -145,9 +274,6 @@ class AjaxDataCoordinator(DataUpdateCoordinator[AjaxCoordinator]):
                 _LOGGER.warning("Jeedom MQTT handler failed to start")
                 return False
                 
-        except ImportError as err:
-            _LOGGER.error("Failed to import Jeedom MQTT handler: %s", err)
-            return False
         except Exception as err:
             _LOGGER.error("Error setting up Jeedom MQTT: %s", err)
             return False
@@ -155,36 +281,43 @@ class AjaxDataCoordinator(DataUpdateCoordinator[AjaxCoordinator]):
     @callback
     def _handle_jeedom_sensor_update(self, device, changed_attr: Optional[str]) -> None:
         """Handle device update from Jeedom MQTT."""
-        from .jeedom_mqtt_handler import JeedomDevice
-        from .models import AjaxDoorSensor, AjaxMotionSensor, AjaxLeakSensor, AjaxFireSensor, AjaxDevice
-        from .const import AjaxDeviceType
-        
         if not isinstance(device, JeedomDevice):
             return
         
-        _LOGGER.debug(
-            "Jeedom device update: %s.%s (type: %s)",
-            device.name,
-            changed_attr,
-            device.device_type,
-        )
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug(
+                "Jeedom device update: %s.%s (type: %s)",
+                device.name,
+                changed_attr,
+                device.device_type,
+            )
         
-        hub_id = self.data.hub.device_id if self.data.hub else "ajax_hub"
+        hub = self.data.hub
+        devices = self.data.devices
+        hub_id = hub.device_id if hub else "ajax_hub"
         device_id = device.device_id
         
         # Skip virtual/aggregate devices
         if device.device_type == "virtual":
-            _LOGGER.debug("Skipping virtual device: %s", device.name)
+            if debug:
+                _LOGGER.debug("Skipping virtual device: %s", device.name)
+            return
+        
+        # Jeedom's hub feeds the existing hub rather than becoming a device
+        if device.device_type == "hub" and hub:
+            if hub.battery_level != device.battery or hub.online != device.online:
+                hub.battery_level = device.battery
+                hub.online = device.online
+                self._schedule_update(hub.device_id)
             return
         
         # Check if device type was updated from unknown to known
         should_recreate = False
-        if device_id in self.data.devices:
-            existing = self.data.devices[device_id]
+        if device_id in devices:
+            existing = devices[device_id]
             # If existing device is generic but now we know the specific type, recreate
-            if (type(existing) == AjaxDevice and 
-                device.device_type != "unknown" and 
-                device.device_type != "hub"):
+            if existing.is_generic and device.device_type not in _NON_UPGRADE_TYPES:
                 should_recreate = True
                 _LOGGER.info(
                     "Upgrading device %s from generic to %s", 
@@ -192,113 +325,59 @@ class AjaxDataCoordinator(DataUpdateCoordinator[AjaxCoordinator]):
                 )
         
         # Create or update device based on device type
-        if device_id not in self.data.devices or should_recreate:
+        added = device_id not in devices or should_recreate
+        if not added and changed_attr is None:
+            # Jeedom republished a state the device already has
+            return
+        if added:
             ajax_device = self._create_device_from_jeedom(device, hub_id)
             if ajax_device:
-                self.data.devices[device_id] = ajax_device
+                devices[device_id] = ajax_device
                 action = "Upgraded" if should_recreate else "Created"
                 _LOGGER.info("%s Ajax device: %s (type: %s)", action, device.name, device.device_type)
         else:
-            ajax_device = self.data.devices[device_id]
+            ajax_device = devices[device_id]
         
         # Update device state
         if ajax_device:
             self._update_device_from_jeedom(ajax_device, device)
         
-        # Notify listeners
-        self.async_set_updated_data(self.data)
+        # Notify listeners, all of them if platforms may need to add entities
+        self._schedule_update(None if added else device_id)
     
     def _create_device_from_jeedom(self, jeedom_device, hub_id: str) -> Optional[AjaxDevice]:
         """Create an Ajax device from Jeedom device data."""
-        from .models import AjaxDoorSensor, AjaxMotionSensor, AjaxLeakSensor, AjaxFireSensor
-        from .const import AjaxDeviceType
-        
         device_type = jeedom_device.device_type
         device_id = jeedom_device.device_id
         name = jeedom_device.name
         
         if device_type == "hub":
-            # Update existing hub instead of creating new device
-            if self.data.hub:
-                self.data.hub.battery_level = jeedom_device.battery
-                self.data.hub.online = jeedom_device.online
-                return None
+            # An existing hub is updated by _handle_jeedom_sensor_update
             return AjaxDevice(
                 device_id=device_id,
                 device_type=AjaxDeviceType.HUB_2,
                 name=name,
                 hub_id=hub_id,
             )
-        elif device_type == "door":
-            return AjaxDoorSensor(
-                device_id=device_id,
-                device_type=AjaxDeviceType.DOOR_PROTECT,
-                name=name,
-                hub_id=hub_id,
-                is_open=jeedom_device.is_open or False,
-            )
-        elif device_type == "motion":
-            return AjaxMotionSensor(
-                device_id=device_id,
-                device_type=AjaxDeviceType.MOTION_PROTECT,
-                name=name,
-                hub_id=hub_id,
-                motion_detected=jeedom_device.motion or False,
-            )
-        elif device_type == "leak":
-            return AjaxLeakSensor(
-                device_id=device_id,
-                device_type=AjaxDeviceType.LEAKS_PROTECT,
-                name=name,
-                hub_id=hub_id,
-                leak_detected=jeedom_device.leak or False,
-            )
-        elif device_type == "smoke":
-            return AjaxFireSensor(
-                device_id=device_id,
-                device_type=AjaxDeviceType.FIRE_PROTECT,
-                name=name,
-                hub_id=hub_id,
-                smoke_detected=jeedom_device.smoke or False,
-                heat_detected=False,
-                co_detected=False,
-            )
-        elif device_type == "siren":
-            return AjaxDevice(
-                device_id=device_id,
-                device_type=AjaxDeviceType.STREET_SIREN,
-                name=name,
-                hub_id=hub_id,
-            )
-        elif device_type == "keypad":
-            return AjaxDevice(
-                device_id=device_id,
-                device_type=AjaxDeviceType.KEYPAD,
-                name=name,
-                hub_id=hub_id,
-            )
-        elif device_type == "remote":
-            return AjaxDevice(
-                device_id=device_id,
-                device_type=AjaxDeviceType.SPACE_CONTROL,
-                name=name,
-                hub_id=hub_id,
-            )
-        else:
+        
+        entry = _JEEDOM_DEVICE_TYPES.get(device_type)
+        if entry is None:
             # For unknown types, try to infer from available attributes
             # Check if this is a virtual/aggregate device (e.g., "Totale", "TLC xxx")
-            is_virtual = any(keyword in name.lower() for keyword in ["totale", "total", "tlc", "somma", "sum"])
+            is_virtual = is_virtual_device(name)
             
-            # Only log warning once per device, and only if not virtual
-            has_attrs = any([
-                jeedom_device.is_open is not None,
-                jeedom_device.motion is not None,
-                jeedom_device.leak is not None,
-                jeedom_device.smoke is not None
-            ])
+            # Infer device type from the first sensor attribute Jeedom reported
+            entry = next(
+                (
+                    inferred for inferred in _JEEDOM_INFERRED_TYPES
+                    if getattr(jeedom_device, inferred[3]) is not None
+                ),
+                None,
+            )
             
+            # Only log warning once per device, and only if not virtual
             if not is_virtual and device_id not in self.data.devices:
-                if has_attrs:
+                if entry is not None:
                     _LOGGER.info(
                         "Unknown device type '%s' for device '%s', inferring from attributes",
                         device_type, name
@@ -309,79 +388,47 @@ class AjaxDataCoordinator(DataUpdateCoordinator[AjaxCoordinator]):
                         name, device_type
                     )
             
-            # Infer device type from available attributes
-            if jeedom_device.is_open is not None:
-                return AjaxDoorSensor(
-                    device_id=device_id,
-                    device_type=AjaxDeviceType.DOOR_PROTECT,
-                    name=name,
-                    hub_id=hub_id,
-                    is_open=jeedom_device.is_open or False,
-                )
-            elif jeedom_device.motion is not None:
-                return AjaxMotionSensor(
-                    device_id=device_id,
-                    device_type=AjaxDeviceType.MOTION_PROTECT,
-                    name=name,
-                    hub_id=hub_id,
-                    motion_detected=jeedom_device.motion or False,
-                )
-            elif jeedom_device.leak is not None:
-                return AjaxLeakSensor(
-                    device_id=device_id,
-                    device_type=AjaxDeviceType.LEAKS_PROTECT,
-                    name=name,
-                    hub_id=hub_id,
-                    leak_detected=jeedom_device.leak or False,
-                )
-            elif jeedom_device.smoke is not None:
-                return AjaxFireSensor(
-                    device_id=device_id,
-                    device_type=AjaxDeviceType.FIRE_PROTECT,
-                    name=name,
-                    hub_id=hub_id,
-                    smoke_detected=jeedom_device.smoke or False,
-                    heat_detected=False,
-                    co_detected=False,
-                )
-            else:
+            if entry is None:
                 # Generic device for truly unknown types
                 return AjaxDevice(
                     device_id=device_id,
                     device_type=AjaxDeviceType.MOTION_PROTECT,
                     name=name,
                     hub_id=hub_id,
+                    is_generic=True,
                 )
+        
+        device_class, ajax_type, state_field, jeedom_attr = entry
+        device = device_class(
+            device_id=device_id,
+            device_type=ajax_type,
+            name=name,
+            hub_id=hub_id,
+        )
+        if state_field is not None:
+            setattr(device, state_field, getattr(jeedom_device, jeedom_attr) or False)
+        return device
     
     def _update_device_from_jeedom(self, ajax_device: AjaxDevice, jeedom_device) -> None:
         """Update Ajax device state from Jeedom device."""
-        # Update common attributes
-        if jeedom_device.online is not None:
-            ajax_device.online = jeedom_device.online
-        if jeedom_device.tamper is not None:
-            ajax_device.tamper = jeedom_device.tamper
-        if jeedom_device.battery is not None:
-            ajax_device.battery_level = jeedom_device.battery
-        if jeedom_device.temperature is not None:
-            ajax_device.temperature = jeedom_device.temperature
-        if jeedom_device.signal is not None:
-            ajax_device.signal_level = jeedom_device.signal
-        
-        # Update type-specific attributes
-        if hasattr(ajax_device, "is_open") and jeedom_device.is_open is not None:
-            ajax_device.is_open = jeedom_device.is_open
-        if hasattr(ajax_device, "motion_detected") and jeedom_device.motion is not None:
-            ajax_device.motion_detected = jeedom_device.motion
-        if hasattr(ajax_device, "leak_detected") and jeedom_device.leak is not None:
-            ajax_device.leak_detected = jeedom_device.leak
-        if hasattr(ajax_device, "smoke_detected") and jeedom_device.smoke is not None:
-            ajax_device.smoke_detected = jeedom_device.smoke
+        # Copy every attribute Jeedom reported that this device type supports
+        for jeedom_attr, field_name in _jeedom_fields(type(ajax_device)):
+            value = getattr(jeedom_device, jeedom_attr)
+            if value is not None:
+                setattr(ajax_device, field_name, value)
         
         # Store Jeedom-specific attributes
-        if not hasattr(ajax_device, "jeedom_data"):
-            ajax_device.jeedom_data = {}
-        ajax_device.jeedom_data["zone"] = jeedom_device.zone
-        ajax_device.jeedom_data["last_update"] = jeedom_device.last_update.isoformat()
+        ajax_device.attributes["zone"] = jeedom_device.zone
+        # Jeedom's signal is a free-text level, not the dBm signal_strength
+        if jeedom_device.signal is not None:
+            ajax_device.attributes["signal"] = jeedom_device.signal
+        # Jeedom only moves last_update_ns when a value changes
+        last_update_ns = jeedom_device.last_update_ns
+        cached = self._last_update_iso.get(ajax_device.device_id)
+        if cached is None or cached[0] != last_update_ns:
+            cached = (last_update_ns, jeedom_device.last_update.isoformat())
+            self._last_update_iso[ajax_device.device_id] = cached
+        ajax_device.attributes["last_update"] = cached[1]
     
     @property
     def jeedom_mqtt_handler(self):
@@ -402,8 +449,8 @@ class AjaxDataCoordinator(DataUpdateCoordinator[AjaxCoordinator]):
         try:
             from .mqtt_publisher import AjaxMqttPublisher, MqttPublisherConfig
             
-            # Get config from entry, merging data and options
-            config_data = {**self.entry.data, **self.entry.options}
+            # Read config from entry, options taking precedence over data
+            config_data = ChainMap(self.entry.options, self.entry.data)
             
             publisher_config = MqttPublisherConfig(
                 enabled=True,
@@ -435,7 +482,7 @@ class AjaxDataCoordinator(DataUpdateCoordinator[AjaxCoordinator]):
     def register_entity_for_mqtt(self, entity_id: str) -> None:
         """Register an entity to be tracked by MQTT publisher."""
         if entity_id not in self._tracked_entity_ids:
-            self._tracked_entity_ids.append(entity_id)
+            self._tracked_entity_ids.add(entity_id)
             # If publisher is already running, track immediately
             if self._mqtt_publisher:
                 self._mqtt_publisher.track_entity(entity_id)
@@ -444,7 +491,7 @@ class AjaxDataCoordinator(DataUpdateCoordinator[AjaxCoordinator]):
         self,
         event_code: str,
         event_description: str,
-        zone: str | None = None,
+        zone: int | str | None = None,
         device_name: str | None = None,
     ) -> None:
         """Publish an alarm event to MQTT."""
@@ -453,16 +500,73 @@ class AjaxDataCoordinator(DataUpdateCoordinator[AjaxCoordinator]):
                 event_code, event_description, zone, device_name
             )
     
+    @callback
+    def async_add_device_listener(
+        self, device_id: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for push updates that only touch the given device."""
+        return async_dispatcher_connect(
+            self.hass, f"{SIGNAL_DEVICE_UPDATE}_{device_id}", update_callback
+        )
+    
+    @callback
+    def _schedule_update(self, device_id: Optional[str] = None) -> None:
+        """Notify listeners once for a burst of push updates.
+        
+        Updates limited to known devices only reach those devices' entities;
+        anything else, such as a new device, goes to every listener.
+        """
+        # Before the platforms subscribe there is nobody to notify; entities
+        # read the current state when they are added
+        if not self._listeners:
+            return
+        
+        if device_id is None:
+            self._updated_devices = None
+        elif self._updated_devices is not None:
+            self._updated_devices.add(device_id)
+        
+        if self._pending_update is None:
+            self._pending_update = self._call_later(
+                UPDATE_DEBOUNCE, self._flush_update
+            )
+    
+    @callback
+    def _flush_update(self) -> None:
+        """Push the coalesced update to listeners."""
+        self._pending_update = None
+        updated, self._updated_devices = self._updated_devices, set()
+        
+        if updated is None:
+            self.async_set_updated_data(self.data)
+            return
+        
+        for device_id in updated:
+            async_dispatcher_send(self.hass, f"{SIGNAL_DEVICE_UPDATE}_{device_id}")
+    
     async def async_shutdown(self) -> None:
         """Shut down the coordinator."""
+        if self._pending_update:
+            self._pending_update.cancel()
+            self._pending_update = None
+        if self._pending_publish:
+            self._pending_publish.cancel()
+            self._pending_publish = None
+        self._pending_alarm_events.clear()
+        self._last_update_iso.clear()
+        
+        # The transports are independent, so stop them concurrently
+        stops = []
         if self._sia_receiver:
-            await self._sia_receiver.stop()
-        
+            stops.append(self._sia_receiver.stop())
         if self._jeedom_mqtt_handler:
-            await self._jeedom_mqtt_handler.async_stop()
-        
+            stops.append(self._jeedom_mqtt_handler.async_stop())
         if self._mqtt_publisher:
-            await self._mqtt_publisher.async_stop()
+            stops.append(self._mqtt_publisher.async_stop())
+        
+        for result in await asyncio.gather(*stops, return_exceptions=True):
+            if isinstance(result, BaseException):
+                _LOGGER.error("Error during shutdown: %r", result)
     
     async def _async_update_data(self) -> AjaxCoordinator:
         """Fetch data from Ajax."""
@@ -472,132 +576,108 @@ class AjaxDataCoordinator(DataUpdateCoordinator[AjaxCoordinator]):
     @callback
     def _handle_sia_event(self, event: SiaEvent) -> None:
         """Handle incoming SIA event."""
-        _LOGGER.info("Processing SIA event: code=%s, zone=%s, account=%s", 
-                     event.event_code, event.zone, event.account)
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug(
+                "Processing SIA event: code=%s, zone=%s, account=%s",
+                event.event_code, event.zone, event.account,
+            )
+        
+        hub = self.data.hub
+        devices = self.data.devices
         
         # Update alarm state
         new_state = sia_event_to_alarm_state(event)
-        if new_state and self.data.hub:
-            self.data.hub.state = new_state
-            self.data.hub.last_event = event.event_code
-            self.data.hub.last_event_time = event.timestamp
+        if new_state and hub:
+            hub.state = new_state
+            hub.last_event = event.event_code
+            hub.last_event_time = event.timestamp
             _LOGGER.info("Hub state changed to: %s", new_state)
+            self._schedule_update(hub.device_id)
         
         # Update sensor state
         sensor_update = sia_event_to_sensor_state(event)
         if sensor_update:
             zone = sensor_update.get("zone")
             if zone:
-                device_id = f"zone_{zone}"
-                sensor_type = sensor_update.get("type", "unknown")
+                device = self._zone_devices.get(zone)
                 
                 # Create device if it doesn't exist
-                if device_id not in self.data.devices:
+                if device is None:
+                    device_id = f"zone_{zone}"
+                    sensor_type = sensor_update.get("type", "unknown")
                     _LOGGER.info("Creating new device for zone %s (type: %s)", zone, sensor_type)
                     device = self._create_device_from_sia(device_id, zone, sensor_type)
                     if device:
-                        self.data.devices[device_id] = device
+                        devices[device_id] = device
+                        self._zone_devices[zone] = device
+                        self._schedule_update()
                 
                 # Update existing device
-                if device_id in self.data.devices:
-                    device = self.data.devices[device_id]
-                    if hasattr(device, "is_open") and "is_open" in sensor_update:
-                        device.is_open = sensor_update["is_open"]
-                        _LOGGER.debug("Zone %s: is_open = %s", zone, device.is_open)
-                    if hasattr(device, "motion_detected") and "motion_detected" in sensor_update:
-                        device.motion_detected = sensor_update["motion_detected"]
-                        _LOGGER.debug("Zone %s: motion = %s", zone, device.motion_detected)
-                    if hasattr(device, "leak_detected") and "leak_detected" in sensor_update:
-                        device.leak_detected = sensor_update["leak_detected"]
-                    if hasattr(device, "smoke_detected") and "smoke_detected" in sensor_update:
-                        device.smoke_detected = sensor_update["smoke_detected"]
-                    if "tamper" in sensor_update:
-                        device.tamper = sensor_update["tamper"]
+                if device:
+                    changed = False
+                    for attr in _sia_sensor_fields(type(device)):
+                        value = sensor_update.get(attr)
+                        if value is not None and getattr(device, attr) != value:
+                            setattr(device, attr, value)
+                            changed = True
+                            if debug:
+                                _LOGGER.debug("Zone %s: %s = %s", zone, attr, value)
+                    
+                    # Repeated alarms/restores for a zone leave nothing to redraw
+                    if changed:
+                        self._schedule_update(device.device_id)
         
         # Publish event to MQTT if enabled
         if self._mqtt_publisher:
-            from .const import SIA_EVENT_CODES
-            event_desc = SIA_EVENT_CODES.get(event.event_code, f"Unknown ({event.event_code})")
-            self.hass.async_create_task(
-                self._mqtt_publisher.async_publish_alarm_event(
-                    event_code=event.event_code,
-                    event_description=event_desc,
-                    zone=event.zone,
-                    device_name=None,
+            event_desc = _sia_event_description(event.event_code, f"Unknown ({event.event_code})")
+            self._pending_alarm_events.append((event.event_code, event_desc, event.zone))
+            if self._pending_publish is None:
+                self._pending_publish = self._call_later(
+                    MQTT_EVENT_BATCH_WINDOW, self._flush_alarm_events
                 )
-            )
-        
-        # Notify listeners
-        self.async_set_updated_data(self.data)
     
-    def _create_device_from_sia(self, device_id: str, zone: str, sensor_type: str) -> Optional[AjaxDevice]:
-        """Create a device based on SIA event type."""
-        from .const import AjaxDeviceType
-        from .models import AjaxDoorSensor, AjaxMotionSensor, AjaxLeakSensor, AjaxFireSensor
-        
-        hub_id = self.data.hub.device_id if self.data.hub else "unknown"
-        name = f"Zone {zone}"
+    @callback
+    def _flush_alarm_events(self) -> None:
+        """Publish the SIA events collected during the batch window."""
+        self._pending_publish = None
+        events = list(self._pending_alarm_events)
+        self._pending_alarm_events.clear()
         
-        if sensor_type == "door":
-            return AjaxDoorSensor(
-                device_id=device_id,
-                device_type=AjaxDeviceType.DOOR_PROTECT,
-                name=name,
-                hub_id=hub_id,
-                is_open=False,
-            )
-        elif sensor_type == "motion":
-            return AjaxMotionSensor(
-                device_id=device_id,
-                device_type=AjaxDeviceType.MOTION_PROTECT,
-                name=name,
-                hub_id=hub_id,
-                motion_detected=False,
-            )
-        elif sensor_type == "leak":
-            return AjaxLeakSensor(
-                device_id=device_id,
-                device_type=AjaxDeviceType.LEAKS_PROTECT,
-                name=name,
-                hub_id=hub_id,
-                leak_detected=False,
-            )
-        elif sensor_type == "fire":
-            return AjaxFireSensor(
-                device_id=device_id,
-                device_type=AjaxDeviceType.FIRE_PROTECT,
-                name=name,
-                hub_id=hub_id,
-                smoke_detected=False,
-                heat_detected=False,
-                co_detected=False,
-            )
-        elif sensor_type == "tamper":
-            # For tamper, we create a generic device
-            return AjaxDevice(
-                device_id=device_id,
-                device_type=AjaxDeviceType.MOTION_PROTECT,
-                name=name,
-                hub_id=hub_id,
-                tamper=True,
+        if self._mqtt_publisher and events:
+            self.hass.async_create_task(
+                self._mqtt_publisher.async_publish_alarm_events(events)
             )
-        
-        return None
+    
+    def _create_device_from_sia(self, device_id: str, zone: int, sensor_type: str) -> Optional[AjaxDevice]:
+        """Create a device based on SIA event type."""
+        entry = _SIA_DEVICE_TYPES.get(sensor_type)
+        if entry is None:
+            return None
+        
+        device_class, ajax_type, extra = entry
+        return device_class(
+            device_id=device_id,
+            device_type=ajax_type,
+            name=f"Zone {zone}",
+            hub_id=self.data.hub.device_id if self.data.hub else "unknown",
+            **extra,
+        )
     
     async def async_arm(self) -> bool:
         """Arm the alarm."""
-        # Arm command requires Jeedom proxy
-        _LOGGER.warning("Arm command requires Jeedom proxy integration")
-        return False
+        return self._command_unavailable("Arm")
     
     async def async_disarm(self) -> bool:
         """Disarm the alarm."""
-        # Disarm command requires Jeedom proxy
-        _LOGGER.warning("Disarm command requires Jeedom proxy integration")
-        return False
+        return self._command_unavailable("Disarm")
     
     async def async_arm_night(self) -> bool:
         """Set night mode."""
-        # Night mode command requires Jeedom proxy
-        _LOGGER.warning("Night mode command requires Jeedom proxy integration")
+        return self._command_unavailable("Night mode")
+    
+    @staticmethod
+    def _command_unavailable(command: str) -> bool:
+        """Report that a panel command needs the Jeedom proxy integration."""
+        _LOGGER.warning("%s command requires Jeedom proxy integration", command)
         return False
@@ -0,0 +1,24 @@
+"""Base entity for Ajax Systems integration."""
+from __future__ import annotations
+
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import AjaxDataCoordinator
+
+
+class AjaxDeviceEntity(CoordinatorEntity[AjaxDataCoordinator]):
+    """Coordinator entity that also follows push updates for its own device."""
+    
+    @property
+    def _listen_device_id(self) -> str:
+        """Return the device whose push updates refresh this entity."""
+        return self._device.device_id
+    
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_device_listener(
+                self._listen_device_id, self._handle_coordinator_update
+            )
+        )
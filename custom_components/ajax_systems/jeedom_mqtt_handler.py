@@ -31,16 +31,22 @@ Each Ajax device has multiple commands:
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
 import re
+import time
+import unicodedata
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any, Callable, Optional
 
 from homeassistant.components import mqtt
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.util.json import json_loads
 
 from .const import DOMAIN
 
@@ -62,6 +68,7 @@ JEEDOM_EQLOGIC_TOPIC = "jeedom/eqLogic"
 
 # Signal for entity updates
 SIGNAL_JEEDOM_UPDATE = f"{DOMAIN}_jeedom_update"
+# Suffixed with the device ID, sent with the device and the changed attribute name
 SIGNAL_JEEDOM_DEVICE_UPDATE = f"{DOMAIN}_jeedom_device_update"
 SIGNAL_JEEDOM_DISCOVERY = f"{DOMAIN}_jeedom_discovery"
 
@@ -121,6 +128,87 @@ COMMAND_MAPPING = {
     "Mode nuit": {"attr": "alarm_state", "binary": False, "value": "night"},
 }
 
+# Values Jeedom sends for binary commands, numeric 0.0/1.0 hash like 0/1
+_BINARY_VALUES: dict[Any, bool] = {0: False, 1: True, "0": False, "1": True}
+
+
+def _parse_binary(value: Any) -> bool:
+    """Parse a binary command value."""
+    try:
+        return _BINARY_VALUES[value]
+    except (KeyError, TypeError):
+        return bool(int(value)) if isinstance(value, (int, float, str)) else bool(value)
+
+
+def _parse_binary_inverted(value: Any) -> bool:
+    """Parse a binary command value whose meaning is inverted."""
+    return not _parse_binary(value)
+
+
+def _parse_temperature(value: Any) -> Optional[float]:
+    """Parse a temperature command value."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _parse_battery(value: Any) -> Optional[int]:
+    """Parse a battery command value, reported as a percentage or CHARGED."""
+    if isinstance(value, str) and value.upper() == "CHARGED":
+        return 100
+    try:
+        return int(float(value))
+    except (ValueError, TypeError):
+        return None
+
+
+def _parse_text(value: Any) -> Optional[str]:
+    """Parse a free-form command value."""
+    return str(value) if value is not None else None
+
+
+def _command_parser(mapping: dict[str, Any]) -> Callable[[Any], Any]:
+    """Select the value parser for a COMMAND_MAPPING entry."""
+    if mapping.get("binary", False):
+        return _parse_binary_inverted if mapping.get("invert", False) else _parse_binary
+    if mapping["attr"] == "temperature":
+        return _parse_temperature
+    if mapping["attr"] == "battery":
+        return _parse_battery
+    if "value" in mapping:
+        fixed_value = mapping["value"]
+        return lambda value: fixed_value
+    return _parse_text
+
+
+# COMMAND_MAPPING resolved to (attr, value parser) once, for the message path
+_COMMAND_ROWS: dict[str, tuple[str, Callable[[Any], Any]]] = {
+    command: (mapping["attr"], _command_parser(mapping))
+    for command, mapping in COMMAND_MAPPING.items()
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_command(command_name: str) -> str:
+    """Return a command name without accents or case, e.g. Température -> temperature."""
+    decomposed = unicodedata.normalize("NFKD", command_name)
+    return decomposed.encode("ascii", "ignore").decode("ascii").lower()
+
+
+# Fallback for commands whose accents or case differ from COMMAND_MAPPING
+_NORMALIZED_COMMAND_ROWS = {
+    _normalize_command(command): row for command, row in _COMMAND_ROWS.items()
+}
+
+
+def _command_row(command_name: str) -> Optional[tuple[str, Callable[[Any], Any]]]:
+    """Return the (attr, value parser) row for a command name."""
+    row = _COMMAND_ROWS.get(command_name)
+    if row is None:
+        row = _NORMALIZED_COMMAND_ROWS.get(_normalize_command(command_name))
+    return row
+
 # French to Italian/English translations
 TRANSLATIONS = {
     # States
@@ -162,6 +250,29 @@ DEVICE_TYPE_PATTERNS = {
     "smoke": ["smoke", "fumée", "fire", "incendie", "fireprotect"],
 }
 
+# Name keywords of virtual/aggregate devices, which are not real sensors
+_VIRTUAL_DEVICE_KEYWORDS = ("totale", "total", "tlc", "somma", "sum", "aggreg")
+
+# Window in seconds for merging per-device dispatcher signals
+DEVICE_SIGNAL_DEBOUNCE = 0.05
+
+# One alternation per type, tried in DEVICE_TYPE_PATTERNS order
+_VIRTUAL_DEVICE_RE = re.compile("|".join(map(re.escape, _VIRTUAL_DEVICE_KEYWORDS)))
+_DEVICE_TYPE_RES = tuple(
+    (dev_type, re.compile("|".join(map(re.escape, patterns))))
+    for dev_type, patterns in DEVICE_TYPE_PATTERNS.items()
+)
+
+
+def is_virtual_device(device_name: str) -> bool:
+    """Return True if the name belongs to a virtual/aggregate device."""
+    return _VIRTUAL_DEVICE_RE.search(device_name.lower()) is not None
+
+# Bracketed humanName segments, and the character classes cleaned from device IDs
+_HUMAN_NAME_PART_RE = re.compile(r'\[([^\]]+)\]')
+_NON_ALNUM_RE = re.compile(r'[^a-zA-Z0-9]')
+_UNDERSCORES_RE = re.compile(r'_+')
+
 # Device type detection based on command names (more reliable)
 COMMAND_TO_DEVICE_TYPE = {
     "Ouvert": "door",
@@ -182,8 +293,22 @@ COMMAND_TO_DEVICE_TYPE = {
     "Alimentation secteur": "hub",
 }
 
+# Fallback for commands whose accents or case differ from COMMAND_TO_DEVICE_TYPE
+_NORMALIZED_COMMAND_TO_DEVICE_TYPE = {
+    _normalize_command(command): dev_type
+    for command, dev_type in COMMAND_TO_DEVICE_TYPE.items()
+}
+
 
-@dataclass
+def _command_device_type(command_name: str) -> Optional[str]:
+    """Return the device type implied by a command name."""
+    dev_type = COMMAND_TO_DEVICE_TYPE.get(command_name)
+    if dev_type is None:
+        dev_type = _NORMALIZED_COMMAND_TO_DEVICE_TYPE.get(_normalize_command(command_name))
+    return dev_type
+
+
+@dataclass(slots=True)
 class JeedomDevice:
     """Represents an Ajax device discovered from Jeedom MQTT."""
     
@@ -214,66 +339,46 @@ class JeedomDevice:
     power: Optional[bool] = None
     
     # Metadata
-    last_update: datetime = field(default_factory=datetime.now)
+    # Wall clock nanoseconds of the last change, see the last_update property
+    last_update_ns: int = field(default_factory=time.time_ns)
     jeedom_commands: dict[str, str] = field(default_factory=dict)  # command_name -> topic_id
     
+    @property
+    def last_update(self) -> datetime:
+        """Return the local time of the last state change."""
+        return datetime.fromtimestamp(self.last_update_ns / 1e9)
+    
     def update_from_command(self, command_name: str, value: Any, topic_id: str) -> bool:
         """Update device state from a Jeedom command.
         
         Returns True if the device state changed.
         """
-        mapping = COMMAND_MAPPING.get(command_name)
-        if not mapping:
+        row = _command_row(command_name)
+        if row is None:
             _LOGGER.debug("Unknown command: %s", command_name)
             return False
         
-        attr = mapping["attr"]
-        is_binary = mapping.get("binary", False)
-        invert = mapping.get("invert", False)
+        attr, parse = row
         
         # Store topic ID for this command
         self.jeedom_commands[command_name] = topic_id
         
         # Process value
-        if is_binary:
-            bool_value = bool(int(value)) if isinstance(value, (int, float, str)) else bool(value)
-            if invert:
-                bool_value = not bool_value
-            old_value = getattr(self, attr, None)
-            setattr(self, attr, bool_value)
-            changed = old_value != bool_value
-        else:
-            # Handle special cases
-            if attr == "temperature":
-                try:
-                    new_value = float(value)
-                except (ValueError, TypeError):
-                    new_value = None
-            elif attr == "battery":
-                if isinstance(value, str) and value.upper() == "CHARGED":
-                    new_value = 100
-                else:
-                    try:
-                        new_value = int(float(value))
-                    except (ValueError, TypeError):
-                        new_value = None
-            elif "value" in mapping:
-                new_value = mapping["value"]
-            else:
-                new_value = str(value) if value is not None else None
-            
-            old_value = getattr(self, attr, None)
-            setattr(self, attr, new_value)
-            changed = old_value != new_value
+        new_value = parse(value)
+        old_value = getattr(self, attr, None)
+        # Jeedom republishes unchanged states, leave those untouched
+        if old_value == new_value:
+            return False
         
-        if changed:
-            self.last_update = datetime.now()
+        setattr(self, attr, new_value)
+        self.last_update_ns = time.time_ns()
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
                 "Device %s: %s changed from %s to %s",
-                self.name, attr, old_value, getattr(self, attr)
+                self.name, attr, old_value, new_value
             )
         
-        return changed
+        return True
 
 
 class JeedomMqttHandler:
@@ -291,16 +396,22 @@ class JeedomMqttHandler:
         self._language = language
         self._unsubscribe: list[Callable] = []
         self._devices: dict[str, JeedomDevice] = {}
-        self._callbacks: list[Callable[[JeedomDevice, str], None]] = []
+        # Read-only view handed out by the devices property, tracks _devices live
+        self._devices_view: Mapping[str, JeedomDevice] = MappingProxyType(self._devices)
+        # Rebuilt on add/remove so message handlers iterate a fixed tuple
+        self._callbacks: tuple[Callable[[JeedomDevice, str], None], ...] = ()
         self._message_count = 0
         self._discovery_count = 0
         self._event_count = 0
         self._topics_seen: set[str] = set()
+        # Changed attributes per device, waiting for the next dispatcher flush
+        self._pending_signals: dict[str, set[str]] = {}
+        self._pending_flush: Optional[asyncio.TimerHandle] = None
         
     @property
-    def devices(self) -> dict[str, JeedomDevice]:
-        """Get all discovered devices."""
-        return self._devices
+    def devices(self) -> Mapping[str, JeedomDevice]:
+        """Get a read-only view of all discovered devices."""
+        return self._devices_view
     
     @property
     def stats(self) -> dict[str, Any]:
@@ -319,26 +430,38 @@ class JeedomMqttHandler:
             return TRANSLATIONS[text].get(self._language, text)
         return text
     
-    def _detect_device_type(self, device_name: str) -> str:
+    # Device, zone and humanName values repeat on every message from the same
+    # device, so the pure parsing helpers below are cached on their inputs.
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _detect_device_type(device_name: str) -> str:
         """Detect device type from name."""
         name_lower = device_name.lower()
         
         # Filter out virtual/aggregate devices
-        virtual_keywords = ["totale", "total", "tlc", "somma", "sum", "aggreg"]
-        if any(keyword in name_lower for keyword in virtual_keywords):
+        if is_virtual_device(device_name):
             _LOGGER.debug("Detected virtual/aggregate device: %s", device_name)
             return "virtual"
         
-        for dev_type, patterns in DEVICE_TYPE_PATTERNS.items():
-            for pattern in patterns:
-                if pattern in name_lower:
-                    return dev_type
+        for dev_type, pattern_re in _DEVICE_TYPE_RES:
+            if pattern_re.search(name_lower):
+                return dev_type
         
         return "unknown"
     
-    def _parse_human_name(self, human_name: str) -> tuple[str, str, str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _parse_human_name(human_name: str) -> tuple[str, str, str]:
         """Parse Jeedom humanName format: [Zone][Device][Command]."""
-        parts = re.findall(r'\[([^\]]+)\]', human_name)
+        parts = None
+        if human_name.startswith("[") and human_name.endswith("]"):
+            parts = human_name[1:-1].split("][")
+            # Empty or nested brackets need the regex to match its results
+            if not all(parts) or any("[" in part or "]" in part for part in parts):
+                parts = None
+        if parts is None:
+            parts = _HUMAN_NAME_PART_RE.findall(human_name)
         
         zone = parts[0] if len(parts) > 0 else ""
         device = parts[1] if len(parts) > 1 else human_name
@@ -346,16 +469,18 @@ class JeedomMqttHandler:
         
         return zone, device, command
     
-    def _get_device_id(self, device_name: str, zone: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _get_device_id(device_name: str, zone: str) -> str:
         """Generate unique device ID."""
         # Clean name for ID
-        clean_name = re.sub(r'[^a-zA-Z0-9]', '_', device_name)
-        clean_name = re.sub(r'_+', '_', clean_name).strip('_').lower()
+        clean_name = _NON_ALNUM_RE.sub('_', device_name)
+        clean_name = _UNDERSCORES_RE.sub('_', clean_name).strip('_').lower()
         
         # Include zone if not empty/default
         if zone and zone.lower() not in ["nessuno", "aucun", "none", ""]:
-            clean_zone = re.sub(r'[^a-zA-Z0-9]', '_', zone)
-            clean_zone = re.sub(r'_+', '_', clean_zone).strip('_').lower()
+            clean_zone = _NON_ALNUM_RE.sub('_', zone)
+            clean_zone = _UNDERSCORES_RE.sub('_', clean_zone).strip('_').lower()
             return f"ajax_{clean_zone}_{clean_name}"
         
         return f"ajax_{clean_name}"
@@ -367,8 +492,7 @@ class JeedomMqttHandler:
         """
         try:
             # Extract topic ID (e.g., "91" from "jeedom/cmd/event/91")
-            topic_parts = topic.split("/")
-            topic_id = topic_parts[-1] if topic_parts else "0"
+            topic_id = topic.rpartition("/")[2]
             
             value = payload.get("value")
             human_name = payload.get("humanName", "")
@@ -407,12 +531,14 @@ class JeedomMqttHandler:
             device = self._devices[device_id]
             
             # Update device type based on command if still unknown
-            if device.device_type == "unknown" and command_name in COMMAND_TO_DEVICE_TYPE:
-                device.device_type = COMMAND_TO_DEVICE_TYPE[command_name]
-                _LOGGER.info(
-                    "Updated device type for %s: %s (from command %s)",
-                    device.name, device.device_type, command_name
-                )
+            if device.device_type == "unknown":
+                command_type = _command_device_type(command_name)
+                if command_type:
+                    device.device_type = command_type
+                    _LOGGER.info(
+                        "Updated device type for %s: %s (from command %s)",
+                        device.name, device.device_type, command_name
+                    )
             
             # Update device from command
             changed = device.update_from_command(command_name, value, topic_id)
@@ -420,8 +546,8 @@ class JeedomMqttHandler:
             # Always notify on first discovery or state change
             if changed or is_new_device:
                 # Return the attribute that changed (or "device_type" for new devices)
-                mapping = COMMAND_MAPPING.get(command_name, {})
-                attr = mapping.get("attr", command_name) if changed else "device_type"
+                row = _command_row(command_name)
+                attr = (row[0] if row else command_name) if changed else "device_type"
                 return (device, attr)
             
             return (device, None)
@@ -436,17 +562,19 @@ class JeedomMqttHandler:
         self._message_count += 1
         
         try:
-            payload = json.loads(msg.payload)
+            payload = json_loads(msg.payload)
             topic = msg.topic
             
-            _LOGGER.debug("MQTT [%s]: %s", topic, payload)
+            debug = _LOGGER.isEnabledFor(logging.DEBUG)
+            if debug:
+                _LOGGER.debug("MQTT [%s]: %s", topic, payload)
             
             result = self._process_message(topic, payload)
             
             if result:
                 device, changed_attr = result
                 
-                if changed_attr:
+                if changed_attr and debug:
                     _LOGGER.debug(
                         "Device %s updated: %s = %s",
                         device.name,
@@ -461,19 +589,33 @@ class JeedomMqttHandler:
                     except Exception as err:
                         _LOGGER.error("Callback error: %s", err)
                 
-                # Send dispatcher signal
-                async_dispatcher_send(
-                    self._hass,
-                    f"{SIGNAL_JEEDOM_DEVICE_UPDATE}_{device.device_id}",
-                    device,
-                    changed_attr,
-                )
+                # Queue dispatcher signal
+                if changed_attr:
+                    self._pending_signals.setdefault(device.device_id, set()).add(changed_attr)
+                    if self._pending_flush is None:
+                        self._pending_flush = self._hass.loop.call_later(
+                            DEVICE_SIGNAL_DEBOUNCE, self._flush_signals
+                        )
                 
         except json.JSONDecodeError as err:
             _LOGGER.warning("Invalid JSON: %s", msg.payload)
         except Exception as err:
             _LOGGER.error("Error handling message: %s", err)
     
+    @callback
+    def _flush_signals(self) -> None:
+        """Send one dispatcher signal per attribute changed during the window."""
+        self._pending_flush = None
+        pending, self._pending_signals = self._pending_signals, {}
+        
+        for device_id, changed_attrs in pending.items():
+            device = self._devices.get(device_id)
+            if device is None:
+                continue
+            signal = f"{SIGNAL_JEEDOM_DEVICE_UPDATE}_{device_id}"
+            for changed_attr in changed_attrs:
+                async_dispatcher_send(self._hass, signal, device, changed_attr)
+    
     @callback
     def _handle_discovery(self, msg) -> None:
         """Handle Jeedom discovery messages."""
@@ -481,7 +623,7 @@ class JeedomMqttHandler:
         self._topics_seen.add(msg.topic)
         
         try:
-            payload = json.loads(msg.payload)
+            payload = json_loads(msg.payload)
             
             _LOGGER.info("🔍 DISCOVERY [%s]: Found %d items", msg.topic, len(payload) if isinstance(payload, list) else 1)
             
@@ -541,7 +683,7 @@ class JeedomMqttHandler:
         self._topics_seen.add(msg.topic)
         
         try:
-            payload = json.loads(msg.payload)
+            payload = json_loads(msg.payload)
             topic = msg.topic
             
             _LOGGER.debug("📢 EVENT [%s]: %s", topic, payload)
@@ -576,12 +718,12 @@ class JeedomMqttHandler:
     
     def add_callback(self, callback_fn: Callable[[JeedomDevice, str], None]) -> None:
         """Add a callback for device updates."""
-        self._callbacks.append(callback_fn)
+        self._callbacks = (*self._callbacks, callback_fn)
     
     def remove_callback(self, callback_fn: Callable[[JeedomDevice, str], None]) -> None:
         """Remove a callback."""
         if callback_fn in self._callbacks:
-            self._callbacks.remove(callback_fn)
+            self._callbacks = tuple(fn for fn in self._callbacks if fn != callback_fn)
     
     async def async_start(self) -> bool:
         """Start listening for MQTT messages."""
@@ -737,6 +879,11 @@ class JeedomMqttHandler:
             unsub()
         self._unsubscribe.clear()
         
+        if self._pending_flush:
+            self._pending_flush.cancel()
+            self._pending_flush = None
+        self._pending_signals.clear()
+        
         _LOGGER.info(
             "Unsubscribed from Jeedom MQTT (messages: %d, discoveries: %d, events: %d, devices: %d)",
             self._message_count,
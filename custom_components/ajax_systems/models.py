@@ -6,7 +6,7 @@ from typing import Any, Optional
 from .const import AjaxAlarmState, AjaxDeviceType
 
 
-@dataclass
+@dataclass(slots=True)
 class AjaxDevice:
     """Representation of an Ajax device."""
     
@@ -20,6 +20,8 @@ class AjaxDevice:
     temperature: Optional[float] = None
     firmware_version: Optional[str] = None
     tamper: bool = False
+    # Placeholder for a device whose type is not known yet
+    is_generic: bool = False
     
     # Device-specific attributes
     attributes: dict[str, Any] = field(default_factory=dict)
@@ -35,7 +37,7 @@ class AjaxDevice:
         return self.device_type.value
 
 
-@dataclass
+@dataclass(slots=True)
 class AjaxHub(AjaxDevice):
     """Representation of an Ajax Hub."""
     
@@ -54,7 +56,7 @@ class AjaxHub(AjaxDevice):
             self.device_type = AjaxDeviceType.HUB
 
 
-@dataclass
+@dataclass(slots=True)
 class AjaxDoorSensor(AjaxDevice):
     """Representation of a door/window sensor."""
     
@@ -66,7 +68,7 @@ class AjaxDoorSensor(AjaxDevice):
             self.device_type = AjaxDeviceType.DOOR_PROTECT
 
 
-@dataclass
+@dataclass(slots=True)
 class AjaxMotionSensor(AjaxDevice):
     """Representation of a motion sensor."""
     
@@ -79,7 +81,7 @@ class AjaxMotionSensor(AjaxDevice):
             self.device_type = AjaxDeviceType.MOTION_PROTECT
 
 
-@dataclass
+@dataclass(slots=True)
 class AjaxLeakSensor(AjaxDevice):
     """Representation of a leak sensor."""
     
@@ -91,7 +93,7 @@ class AjaxLeakSensor(AjaxDevice):
             self.device_type = AjaxDeviceType.LEAKS_PROTECT
 
 
-@dataclass
+@dataclass(slots=True)
 class AjaxFireSensor(AjaxDevice):
     """Representation of a fire/smoke sensor."""
     
@@ -105,7 +107,7 @@ class AjaxFireSensor(AjaxDevice):
             self.device_type = AjaxDeviceType.FIRE_PROTECT
 
 
-@dataclass
+@dataclass(slots=True)
 class AjaxGlassSensor(AjaxDevice):
     """Representation of a glass break sensor."""
     
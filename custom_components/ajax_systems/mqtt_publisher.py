@@ -5,6 +5,7 @@ It allows other systems to subscribe to Ajax state changes.
 """
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from dataclasses import dataclass
@@ -220,7 +221,7 @@ class AjaxMqttPublisher:
         self,
         event_code: str,
         event_description: str,
-        zone: str | None = None,
+        zone: int | str | None = None,
         device_name: str | None = None,
     ) -> None:
         """Publish an alarm event to MQTT."""
@@ -236,6 +237,20 @@ class AjaxMqttPublisher:
         
         await self.async_publish_event("alarm", event_data)
     
+    async def async_publish_alarm_events(
+        self,
+        events: list[tuple[str, str, int | None]],
+    ) -> None:
+        """Publish a batch of alarm events to MQTT, one message per event.
+        
+        The publishes are started in arrival order and awaited together, so
+        the broker receives them back to back instead of one round trip each.
+        """
+        await asyncio.gather(*(
+            self.async_publish_alarm_event(event_code, event_description, zone)
+            for event_code, event_description, zone in events
+        ))
+    
     async def async_publish_command_result(
         self,
         command: str,
@@ -14,10 +14,10 @@ from homeassistant.const import PERCENTAGE, SIGNAL_STRENGTH_DECIBELS_MILLIWATT
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import AjaxDataCoordinator
+from .entity import AjaxDeviceEntity
 from .models import AjaxDevice
 
 _LOGGER = logging.getLogger(__name__)
@@ -51,7 +51,7 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class AjaxBatterySensor(CoordinatorEntity[AjaxDataCoordinator], SensorEntity):
+class AjaxBatterySensor(AjaxDeviceEntity, SensorEntity):
     """Representation of an Ajax battery sensor."""
     
     _attr_device_class = SensorDeviceClass.BATTERY
@@ -102,7 +102,7 @@ class AjaxBatterySensor(CoordinatorEntity[AjaxDataCoordinator], SensorEntity):
         self.async_write_ha_state()
 
 
-class AjaxSignalSensor(CoordinatorEntity[AjaxDataCoordinator], SensorEntity):
+class AjaxSignalSensor(AjaxDeviceEntity, SensorEntity):
     """Representation of an Ajax signal strength sensor."""
     
     _attr_device_class = SensorDeviceClass.SIGNAL_STRENGTH
@@ -151,7 +151,7 @@ class AjaxSignalSensor(CoordinatorEntity[AjaxDataCoordinator], SensorEntity):
         self.async_write_ha_state()
 
 
-class AjaxTemperatureSensor(CoordinatorEntity[AjaxDataCoordinator], SensorEntity):
+class AjaxTemperatureSensor(AjaxDeviceEntity, SensorEntity):
     """Representation of an Ajax temperature sensor."""
     
     _attr_device_class = SensorDeviceClass.TEMPERATURE
@@ -21,6 +21,7 @@ CREDITS & RESOURCES:
   https://www.home-assistant.io/integrations/sia/
 """
 import asyncio
+import functools
 import logging
 import re
 from dataclasses import dataclass
@@ -316,8 +317,22 @@ class SiaReceiver:
 
 def sia_event_to_alarm_state(event: SiaEvent) -> Optional[AjaxAlarmState]:
     """Convert SIA event to alarm state."""
-    code = event.event_code
+    return _alarm_state_for_code(event.event_code)
+
+
+def sia_event_to_sensor_state(event: SiaEvent) -> Optional[dict]:
+    """Convert SIA event to sensor state update."""
+    update = _sensor_update_for_code(event.event_code)
+    if update is None:
+        return None
     
+    sensor_type, attr, value = update
+    return {"zone": event.zone, "type": sensor_type, attr: value}
+
+
+@functools.lru_cache(maxsize=64)
+def _alarm_state_for_code(code: str) -> Optional[AjaxAlarmState]:
+    """Return the alarm state a SIA event code maps to."""
     # Arm/Disarm events
     if code == "CL":  # Closing (Armed)
         return AjaxAlarmState.ARMED_AWAY
@@ -340,51 +355,34 @@ def sia_event_to_alarm_state(event: SiaEvent) -> Optional[AjaxAlarmState]:
     return None
 
 
-def sia_event_to_sensor_state(event: SiaEvent) -> Optional[dict]:
-    """Convert SIA event to sensor state update."""
-    code = event.event_code
-    zone = event.zone
-    
-    result = {"zone": zone}
-    
+@functools.lru_cache(maxsize=64)
+def _sensor_update_for_code(code: str) -> Optional[tuple[str, str, bool]]:
+    """Return the (sensor type, attribute, value) a SIA event code maps to."""
     # Door/window sensors
     if code == "ZO":  # Zone open
-        result["type"] = "door"
-        result["is_open"] = True
+        return ("door", "is_open", True)
     elif code == "ZC":  # Zone closed
-        result["type"] = "door"
-        result["is_open"] = False
+        return ("door", "is_open", False)
     
     # Alarm events
     elif code == "BA":  # Burglar alarm
-        result["type"] = "motion"
-        result["motion_detected"] = True
+        return ("motion", "motion_detected", True)
     elif code == "BR":  # Burglar restore
-        result["type"] = "motion"
-        result["motion_detected"] = False
+        return ("motion", "motion_detected", False)
     
     elif code == "FA":  # Fire alarm
-        result["type"] = "fire"
-        result["smoke_detected"] = True
+        return ("fire", "smoke_detected", True)
     elif code == "FR":  # Fire restore
-        result["type"] = "fire"
-        result["smoke_detected"] = False
+        return ("fire", "smoke_detected", False)
     
     elif code == "WA":  # Water alarm
-        result["type"] = "leak"
-        result["leak_detected"] = True
+        return ("leak", "leak_detected", True)
     elif code == "WR":  # Water restore
-        result["type"] = "leak"
-        result["leak_detected"] = False
+        return ("leak", "leak_detected", False)
     
     elif code == "TA":  # Tamper alarm
-        result["type"] = "tamper"
-        result["tamper"] = True
+        return ("tamper", "tamper", True)
     elif code == "TR":  # Tamper restore
-        result["type"] = "tamper"
-        result["tamper"] = False
+        return ("tamper", "tamper", False)
     
-    else:
-        return None
-    
-    return result
+    return None
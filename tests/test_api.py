@@ -1,4 +1,5 @@
 """Tests for Ajax Systems API - Jeedom Proxy."""
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 import aiohttp
@@ -77,6 +78,42 @@ class TestJeedomAjaxProxy:
             
             assert proxy._authenticated is True
     
+    @pytest.mark.asyncio
+    async def test_get_hubs_skips_failed_hub(self, proxy):
+        """Test a failing hub detail request does not drop the other hubs."""
+        async def fake_request(path, data=None, method="GET"):
+            if path == "/user/{userId}/hubs":
+                return [{"hubId": "hub1"}, {"hubId": "hub2"}, {"hubId": "hub3"}]
+            if path == "/user/{userId}/hubs/hub2":
+                raise JeedomConnectionError("Connection refused")
+            return {"name": path.rsplit("/", 1)[-1].title()}
+        
+        with patch.object(proxy, "_ensure_authenticated", AsyncMock()), \
+                patch.object(proxy, "_request", side_effect=fake_request):
+            hubs = await proxy.get_hubs()
+        
+        assert [hub.hub_id for hub in hubs] == ["hub1", "hub3"]
+        assert [hub.name for hub in hubs] == ["Hub1", "Hub3"]
+        assert set(proxy.hubs) == {"hub1", "hub3"}
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_authenticate_once(self, proxy):
+        """Test concurrent callers share a single authentication."""
+        async def fake_authenticate():
+            await asyncio.sleep(0)
+            proxy._authenticated = True
+            return True
+        
+        with patch.object(
+            proxy, "authenticate", AsyncMock(side_effect=fake_authenticate)
+        ) as mock_auth:
+            await asyncio.gather(
+                proxy._ensure_authenticated(),
+                proxy._ensure_authenticated(),
+            )
+        
+        mock_auth.assert_awaited_once()
+    
     @pytest.mark.asyncio
     async def test_close_session(self, proxy):
         """Test closing proxy session."""
@@ -86,6 +123,15 @@ class TestJeedomAjaxProxy:
         await proxy.close()
         
         mock_session.close.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_async_context_manager(self, proxy):
+        """Test proxy closes itself exactly once when used as a context."""
+        with patch.object(proxy, "close", AsyncMock()) as mock_close:
+            async with proxy as entered:
+                assert entered is proxy
+        
+        mock_close.assert_awaited_once()
 
 
 class TestJeedomProxyErrors:
@@ -105,6 +151,12 @@ class TestJeedomProxyErrors:
         assert str(error) == "Authentication failed"
         assert isinstance(error, JeedomProxyError)
     
+    def test_error_status(self):
+        """Test HTTP status code carried by proxy errors."""
+        assert JeedomProxyError("Not found", status=404).status == 404
+        assert JeedomAuthError("Access denied", status=403).status == 403
+        assert JeedomConnectionError("Connection refused").status is None
+    
     def test_connection_error(self):
         """Test JeedomConnectionError."""
         error = JeedomConnectionError("Connection refused")
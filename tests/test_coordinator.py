@@ -0,0 +1,237 @@
+"""Tests for Ajax Systems coordinator push updates."""
+from collections import defaultdict
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.exceptions import ConfigEntryNotReady
+
+from custom_components.ajax_systems import coordinator as coordinator_module
+from custom_components.ajax_systems.const import AjaxDeviceType
+from custom_components.ajax_systems.coordinator import (
+    AjaxDataCoordinator,
+    MQTT_EVENT_BATCH_WINDOW,
+    SIGNAL_DEVICE_UPDATE,
+    UPDATE_DEBOUNCE,
+)
+from custom_components.ajax_systems.jeedom_mqtt_handler import JeedomDevice
+from custom_components.ajax_systems.models import AjaxDevice, AjaxHub, SiaEvent
+from custom_components.ajax_systems.mqtt_publisher import (
+    AjaxMqttPublisher,
+    MqttPublisherConfig,
+)
+from custom_components.ajax_systems.sensor import AjaxBatterySensor
+
+
+@pytest.fixture
+def coordinator(mock_hass, mock_config_entry):
+    """Create a coordinator with an in-memory dispatcher."""
+    mock_hass.loop = MagicMock()
+    signals = defaultdict(list)
+    
+    def connect(hass, signal, target):
+        signals[signal].append(target)
+        return lambda: signals[signal].remove(target)
+    
+    def send(hass, signal, *args):
+        for target in list(signals[signal]):
+            target(*args)
+    
+    with patch.object(coordinator_module, "async_dispatcher_connect", connect), \
+            patch.object(coordinator_module, "async_dispatcher_send", send):
+        coordinator = AjaxDataCoordinator(mock_hass, mock_config_entry)
+        for device_id, device_type in (
+            ("door1", AjaxDeviceType.DOOR_PROTECT),
+            ("motion1", AjaxDeviceType.MOTION_PROTECT),
+        ):
+            coordinator.data.devices[device_id] = AjaxDevice(
+                device_id=device_id,
+                device_type=device_type,
+                name=device_id,
+                hub_id="test_hub",
+                battery_level=100,
+            )
+        yield coordinator
+
+
+async def _add_entity(coordinator, device_id):
+    """Add a battery sensor for a device and return it."""
+    entity = AjaxBatterySensor(coordinator, coordinator.data.devices[device_id])
+    entity.hass = coordinator.hass
+    entity.async_write_ha_state = MagicMock()
+    await entity.async_added_to_hass()
+    return entity
+
+
+class TestSetup:
+    """Test coordinator setup failures."""
+    
+    @pytest.mark.asyncio
+    async def test_failed_transport_retries_entry(self, coordinator):
+        """Test a failing transport shuts down and raises ConfigEntryNotReady."""
+        with patch.object(coordinator, "_setup_sia", AsyncMock(side_effect=OSError("boom"))), \
+                patch.object(coordinator, "_setup_jeedom_mqtt", AsyncMock(return_value=True)), \
+                patch.object(coordinator, "async_shutdown", AsyncMock()) as shutdown:
+            with pytest.raises(ConfigEntryNotReady) as err:
+                await coordinator.async_setup()
+        
+        shutdown.assert_awaited_once()
+        assert isinstance(err.value.__cause__, OSError)
+
+
+class TestDeviceEntityUpdates:
+    """Test entities only refresh for the devices that changed."""
+    
+    @pytest.mark.asyncio
+    async def test_device_update_only_refreshes_its_entities(self, coordinator):
+        """Test a per-device update skips other devices' entities."""
+        door = await _add_entity(coordinator, "door1")
+        motion = await _add_entity(coordinator, "motion1")
+        
+        coordinator._schedule_update("door1")
+        coordinator._flush_update()
+        
+        door.async_write_ha_state.assert_called_once()
+        motion.async_write_ha_state.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_full_update_refreshes_every_entity(self, coordinator):
+        """Test an update without a device notifies every entity."""
+        door = await _add_entity(coordinator, "door1")
+        motion = await _add_entity(coordinator, "motion1")
+        
+        coordinator._schedule_update(None)
+        coordinator._flush_update()
+        
+        door.async_write_ha_state.assert_called_once()
+        motion.async_write_ha_state.assert_called_once()
+
+
+class TestScheduleUpdate:
+    """Test push updates are coalesced into one notification."""
+    
+    @pytest.fixture
+    def listener(self, coordinator):
+        """Register a coordinator listener."""
+        listener = MagicMock()
+        coordinator.async_add_listener(listener)
+        return listener
+    
+    def test_rapid_updates_flush_once(self, coordinator, listener):
+        """Test a burst of updates starts a single timer and flush."""
+        call_later = coordinator.hass.loop.call_later
+        
+        for device_id in ("door1", "motion1", "door1"):
+            coordinator._schedule_update(device_id)
+        
+        call_later.assert_called_once_with(UPDATE_DEBOUNCE, coordinator._flush_update)
+        assert coordinator._updated_devices == {"door1", "motion1"}
+        
+        with patch.object(coordinator_module, "async_dispatcher_send") as send:
+            coordinator._flush_update()
+        
+        assert sorted(call.args[1] for call in send.call_args_list) == [
+            f"{SIGNAL_DEVICE_UPDATE}_door1",
+            f"{SIGNAL_DEVICE_UPDATE}_motion1",
+        ]
+        assert coordinator._pending_update is None
+        assert coordinator._updated_devices == set()
+    
+    def test_full_update_wins_over_device_ids(self, coordinator, listener):
+        """Test a None update before or after device ids notifies everyone."""
+        coordinator._schedule_update("door1")
+        coordinator._schedule_update(None)
+        coordinator._schedule_update("motion1")
+        
+        assert coordinator._updated_devices is None
+        
+        with patch.object(coordinator_module, "async_dispatcher_send") as send, \
+                patch.object(coordinator, "async_set_updated_data") as set_data:
+            coordinator._flush_update()
+        
+        set_data.assert_called_once_with(coordinator.data)
+        send.assert_not_called()
+        assert coordinator._updated_devices == set()
+    
+    def test_jeedom_hub_update_only_refreshes_hub(self, coordinator, listener):
+        """Test Jeedom hub messages refresh the hub, and only when it changed."""
+        coordinator.data.hub = AjaxHub(
+            device_id="test_hub",
+            device_type=AjaxDeviceType.HUB,
+            name="Hub",
+            hub_id="test_hub",
+        )
+        jeedom_hub = JeedomDevice(
+            device_id="ajax_hub", name="Hub", zone="", device_type="hub",
+            online=True, battery=80,
+        )
+        
+        coordinator._handle_jeedom_sensor_update(jeedom_hub, "battery")
+        
+        assert coordinator.data.hub.battery_level == 80
+        assert coordinator._updated_devices == {"test_hub"}
+        assert "ajax_hub" not in coordinator.data.devices
+        
+        coordinator._flush_update()
+        coordinator._handle_jeedom_sensor_update(jeedom_hub, "device_type")
+        
+        coordinator.hass.loop.call_later.assert_called_once()
+        assert coordinator._updated_devices == set()
+    
+    def test_no_listeners_skips_scheduling(self, coordinator):
+        """Test nothing is scheduled before any entity subscribes."""
+        coordinator._schedule_update("door1")
+        coordinator._schedule_update(None)
+        
+        coordinator.hass.loop.call_later.assert_not_called()
+        assert coordinator._pending_update is None
+        assert coordinator._updated_devices == set()
+
+
+class TestAlarmEventBatching:
+    """Test SIA events are published to MQTT in batches."""
+    
+    def test_burst_publishes_in_one_task(self, coordinator):
+        """Test a burst of SIA events is flushed once, in arrival order."""
+        coordinator._mqtt_publisher = MagicMock()
+        call_later = coordinator.hass.loop.call_later
+        
+        for code, zone in (("RP", None), ("XX", 3), ("RP", 7)):
+            coordinator._handle_sia_event(SiaEvent(account="AAA", event_code=code, zone=zone))
+        
+        call_later.assert_called_once_with(
+            MQTT_EVENT_BATCH_WINDOW, coordinator._flush_alarm_events
+        )
+        
+        coordinator._flush_alarm_events()
+        
+        coordinator.hass.async_create_task.assert_called_once()
+        coordinator._mqtt_publisher.async_publish_alarm_events.assert_called_once_with([
+            ("RP", "Automatic Test (Periodic Report)", None),
+            ("XX", "Unknown (XX)", 3),
+            ("RP", "Automatic Test (Periodic Report)", 7),
+        ])
+        assert coordinator._pending_publish is None
+        assert not coordinator._pending_alarm_events
+    
+    @pytest.mark.asyncio
+    async def test_publisher_keeps_event_order(self, mock_hass):
+        """Test each batched event is its own message, sent in order."""
+        mock_hass.helpers = MagicMock()
+        publisher = AjaxMqttPublisher(
+            mock_hass, MqttPublisherConfig(enabled=True), "test_hub"
+        )
+        publisher._is_running = True
+        
+        with patch(
+            "custom_components.ajax_systems.mqtt_publisher.mqtt.async_publish",
+            AsyncMock(),
+        ) as publish:
+            await publisher.async_publish_alarm_events([
+                ("BA", "Burglary Alarm", 3),
+                ("BR", "Burglary Restore", 3),
+            ])
+        
+        payloads = [call.args[2] for call in publish.call_args_list]
+        assert [json.loads(payload)["code"] for payload in payloads] == ["BA", "BR"]
+        assert all(json.loads(payload)["zone"] == 3 for payload in payloads)
@@ -0,0 +1,137 @@
+"""Tests for Ajax Systems Jeedom MQTT handler."""
+import pytest
+from unittest.mock import MagicMock, patch
+
+from custom_components.ajax_systems.jeedom_mqtt_handler import (
+    JeedomMqttHandler,
+    SIGNAL_JEEDOM_DEVICE_UPDATE,
+    _HUMAN_NAME_PART_RE,
+    _command_device_type,
+    is_virtual_device,
+)
+
+
+def _regex_parse_human_name(human_name):
+    """Parse a humanName with the regex alone, as before the fast path."""
+    parts = _HUMAN_NAME_PART_RE.findall(human_name)
+    zone = parts[0] if len(parts) > 0 else ""
+    device = parts[1] if len(parts) > 1 else human_name
+    command = parts[2] if len(parts) > 2 else ""
+    return zone, device, command
+
+
+class TestParseHumanName:
+    """Test the humanName fast path agrees with the regex."""
+    
+    @pytest.mark.parametrize(
+        "human_name",
+        [
+            # Well formed
+            "[Salon][Porte][Ouverture]",
+            "[Aucun][Détecteur][Présence]",
+            # Missing groups
+            "[Salon][Porte]",
+            "[Salon]",
+            "Porte",
+            "",
+            # Extra groups
+            "[A][B][C][D]",
+            "[Salon][Porte][Ouverture]]",
+            # Empty parts
+            "[]",
+            "[][]",
+            "[A][][C]",
+            "[ ][B][C]",
+            # Text between or around groups
+            "[A]x[B][C]",
+            "[A] [B] [C]",
+            "prefix [A][B][C]",
+            "[Salon][Porte][Ouverture] suffix",
+            # Nested or stray brackets
+            "[A[B][C]",
+            "[[A][B]",
+            "[A]]",
+            "[]]",
+        ],
+    )
+    def test_matches_regex(self, human_name):
+        """Test malformed names parse the same as with the regex."""
+        assert JeedomMqttHandler._parse_human_name(human_name) == (
+            _regex_parse_human_name(human_name)
+        )
+
+
+class TestCommandDeviceType:
+    """Test device type detection from command names."""
+    
+    @pytest.mark.parametrize(
+        ("command_name", "expected"),
+        [
+            ("Fermé", "door"),
+            ("Ferme", "door"),
+            ("FERMÉE", "door"),
+            ("Fumee detectee", "smoke"),
+            ("fuite d'eau", "leak"),
+            ("Batterie", None),
+        ],
+    )
+    def test_normalized_fallback(self, command_name, expected):
+        """Test accent and case variants resolve to the same type."""
+        assert _command_device_type(command_name) == expected
+    
+    def test_unknown_device_typed_from_unaccented_command(self):
+        """Test a command without accents still sets the device type."""
+        handler = JeedomMqttHandler(MagicMock())
+        
+        result = handler._process_message(
+            "jeedom/cmd/event/91",
+            {"value": 1, "humanName": "[Salon][Capteur 1][Ferme]", "name": "Ferme"},
+        )
+        
+        assert result is not None
+        device, _ = result
+        assert device.device_type == "door"
+
+
+class TestDeviceSignals:
+    """Test merged per-device dispatcher signals."""
+    
+    def test_flush_sends_attribute_names(self):
+        """Test each changed attribute is sent once, as a string."""
+        handler = JeedomMqttHandler(MagicMock())
+        handler._process_message(
+            "jeedom/cmd/event/91",
+            {"value": 1, "humanName": "[Salon][Porte][Ouverture]", "name": "Ouverture"},
+        )
+        device = next(iter(handler.devices.values()))
+        handler._pending_signals[device.device_id] = {"is_open", "battery_level"}
+        
+        with patch(
+            "custom_components.ajax_systems.jeedom_mqtt_handler.async_dispatcher_send"
+        ) as send:
+            handler._flush_signals()
+        
+        signal = f"{SIGNAL_JEEDOM_DEVICE_UPDATE}_{device.device_id}"
+        assert sorted(call.args[1:] for call in send.call_args_list) == [
+            (signal, device, "battery_level"),
+            (signal, device, "is_open"),
+        ]
+        assert handler._pending_signals == {}
+
+
+class TestVirtualDevice:
+    """Test virtual/aggregate device detection."""
+    
+    @pytest.mark.parametrize(
+        ("device_name", "expected"),
+        [
+            ("Totale consumi", True),
+            ("TLC Salon", True),
+            ("Aggregato zone", True),
+            ("Porta ingresso", False),
+            ("MATRIMONIALE IR", False),
+        ],
+    )
+    def test_is_virtual_device(self, device_name, expected):
+        """Test names with aggregate keywords are virtual."""
+        assert is_virtual_device(device_name) is expected